@@ -1,32 +1,57 @@
 """ALM REST API client."""
 
+import asyncio
+import sys
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 
 import httpx
+import orjson
 
 from alm_scraper.config import Config
+from alm_scraper.page_cache import PageCache
+from alm_scraper.rate_limit import MAX_RETRIES, RETRY_STATUSES, TokenBucket, retry_delay
 
 
 class ALMClient:
     """Client for ALM REST API."""
 
-    def __init__(self, config: Config, debug: bool = False) -> None:
+    def __init__(
+        self,
+        config: Config,
+        debug: bool = False,
+        cache: PageCache | None = None,
+        rate: float = 1.0,
+        transport: httpx.MockTransport | None = None,
+    ) -> None:
         """Initialize the client.
 
         Args:
             config: Configuration with base_url, domain, project, and cookies.
             debug: If True, print request/response details.
+            cache: Optional page cache; when set, pages are requested
+                conditionally and unchanged (304) pages are served from it.
+            rate: Maximum requests per second (be polite). Zero or negative
+                disables limiting.
+            transport: Optional transport for both the sync and async HTTP
+                clients, e.g. an httpx.MockTransport in tests.
         """
         self.config = config
         self.base_url = config.base_url
         self.domain = config.domain
         self.project = config.project
         self.debug = debug
+        self.cache = cache
+        self._bucket = TokenBucket(rate)
+        self._transport = transport
+
+        # Fixed per client; only page-size/start-index change between pages
+        self._defects_path = f"/rest/domains/{self.domain}/projects/{self.project}/defects"
+        self._params_template = {"order-by": "{id[asc];}"}
 
         # Build cookie header string
-        cookie_str = "; ".join(f"{k}={v}" for k, v in config.cookies.items())
+        cookie_str = "; ".join([f"{k}={v}" for k, v in config.cookies.items()])
 
         self.headers = {
             "Accept": "application/json",
@@ -34,6 +59,122 @@ class ALMClient:
             "alm-client-type": "ALM Web Client UI",
         }
 
+        # One pooled client for the whole sync so every page after the first
+        # reuses the keep-alive connection instead of redoing TCP/TLS setup.
+        # Don't follow redirects - ALM redirects to login on auth failure
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=60.0,
+            follow_redirects=False,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            transport=transport,
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def __enter__(self) -> "ALMClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _debug_request(self, path: str, params: dict[str, str]) -> None:
+        """Print request details to stderr."""
+        print(f"[DEBUG] GET {self.base_url}{path}", file=sys.stderr)
+        print(f"[DEBUG] Params: {params}", file=sys.stderr)
+        print(f"[DEBUG] Headers: {self.headers}", file=sys.stderr)
+
+    def _debug_response(self, response: httpx.Response) -> None:
+        """Print response status, headers, and (for errors/redirects) body to stderr."""
+        print(f"[DEBUG] Status: {response.status_code}", file=sys.stderr)
+        print("[DEBUG] Response headers:", file=sys.stderr)
+        for k, v in response.headers.items():
+            print(f"[DEBUG]   {k}: {v}", file=sys.stderr)
+        print(
+            f"[DEBUG] Body: {response.num_bytes_downloaded} bytes on the wire, "
+            f"{len(response.content)} decoded",
+            file=sys.stderr,
+        )
+        if response.status_code >= 400 or response.status_code in (301, 302, 303, 307, 308):
+            # Show body for errors/redirects; decode only the bytes we show
+            # rather than the whole (possibly multi-MB) body
+            body = response.content[:1000].decode(response.encoding or "utf-8", errors="replace")
+            print("[DEBUG] Response body (first 1000 bytes):", file=sys.stderr)
+            print(f"[DEBUG]   {body}", file=sys.stderr)
+
+    def _get(self, path: str, params: dict[str, str], headers: dict[str, str]) -> httpx.Response:
+        """GET through the rate limiter, retrying while the server pushes back.
+
+        429/503 responses are retried after the server's Retry-After (or an
+        exponential backoff); the last response is returned either way.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            self._bucket.acquire()
+            if self.debug:
+                self._debug_request(path, params)
+            response = self._client.get(path, params=params, headers=headers)
+            if self.debug:
+                self._debug_response(response)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            time.sleep(retry_delay(response.headers.get("Retry-After"), attempt))
+        return response
+
+    async def _get_async(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict[str, str],
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Async counterpart of `_get`, sharing the same rate limiter."""
+        for attempt in range(MAX_RETRIES + 1):
+            await self._bucket.acquire_async()
+            if self.debug:
+                self._debug_request(path, params)
+            response = await client.get(path, params=params, headers=headers)
+            if self.debug:
+                self._debug_response(response)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            await asyncio.sleep(retry_delay(response.headers.get("Retry-After"), attempt))
+        return response
+
+    def _page_params(self, page_size: int, start_index: int) -> dict[str, str]:
+        """Build query params for one page of defects."""
+        return self._params_template | {
+            "page-size": str(page_size),
+            "start-index": str(start_index),
+        }
+
+    def _conditional_headers(self, cache_key: str | None) -> dict[str, str]:
+        """Get validator headers for a cached page, if caching is enabled."""
+        if self.cache is None or cache_key is None:
+            return {}
+        return self.cache.conditional_headers(cache_key)
+
+    def _page_data(self, response: httpx.Response, cache_key: str | None) -> dict[str, Any] | None:
+        """Decode a page response, serving 304s from and saving 200s to the cache.
+
+        Returns None for a 304 whose cached body has gone missing; the caller
+        should re-request the page unconditionally.
+
+        Raises:
+            httpx.HTTPStatusError: On HTTP errors.
+        """
+        if self.cache is not None and cache_key is not None:
+            if response.status_code == 304:
+                return self.cache.load(cache_key)
+            response.raise_for_status()
+            self.cache.store(cache_key, response)
+            return orjson.loads(response.content)
+
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def fetch_defects_page(self, page_size: int = 1000, start_index: int = 1) -> dict[str, Any]:
         """Fetch a page of defects.
 
@@ -47,60 +188,68 @@ class ALMClient:
         Raises:
             httpx.HTTPStatusError: On HTTP errors.
         """
-        url = f"{self.base_url}/rest/domains/{self.domain}/projects/{self.project}/defects"
+        path = self._defects_path
+        params = self._page_params(page_size, start_index)
 
-        params = {
-            "page-size": str(page_size),
-            "start-index": str(start_index),
-            "order-by": "{id[asc];}",
-        }
+        cache_key = self.cache.key(path, params) if self.cache is not None else None
+        conditional = self._conditional_headers(cache_key)
 
-        if self.debug:
-            import sys
+        response = self._get(path, params, conditional)
 
-            print(f"[DEBUG] GET {url}", file=sys.stderr)
-            print(f"[DEBUG] Params: {params}", file=sys.stderr)
-            print(f"[DEBUG] Headers: {self.headers}", file=sys.stderr)
+        data = self._page_data(response, cache_key)
+        if data is None:
+            response = self._get(path, params, {})
+            data = self._page_data(response, cache_key)
 
-        # Don't follow redirects - ALM redirects to login on auth failure
-        response = httpx.get(
-            url, headers=self.headers, params=params, timeout=60.0, follow_redirects=False
-        )
+        return data or {}
 
-        if self.debug:
-            print(f"[DEBUG] Status: {response.status_code}", file=sys.stderr)
-            print("[DEBUG] Response headers:", file=sys.stderr)
-            for k, v in response.headers.items():
-                print(f"[DEBUG]   {k}: {v}", file=sys.stderr)
-            if response.status_code >= 400 or response.status_code in (301, 302, 303, 307, 308):
-                # Show body for errors/redirects
-                body = response.text[:1000]
-                print("[DEBUG] Response body (first 1000 chars):", file=sys.stderr)
-                print(f"[DEBUG]   {body}", file=sys.stderr)
+    def fetch_defects_summary(self) -> tuple[int, str | None]:
+        """Fetch the defect count and newest modification time in one small request.
 
+        Asks for a single defect ordered by last-modified, so the response
+        carries TotalResults plus the most recent change without paging.
+
+        Returns:
+            Tuple of (total_results, newest last-modified value or None).
+
+        Raises:
+            httpx.HTTPStatusError: On HTTP errors.
+        """
+        params = {
+            "page-size": "1",
+            "start-index": "1",
+            "order-by": "{last-modified[desc];}",
+            "fields": "last-modified",
+        }
+        response = self._get(self._defects_path, params, {})
         response.raise_for_status()
+        data = orjson.loads(response.content)
 
-        return response.json()
+        last_modified = None
+        if entities := data.get("entities"):
+            fields = {f.get("Name"): f.get("values") for f in entities[0].get("Fields", [])}
+            values = fields.get("last-modified") or [{}]
+            last_modified = values[0].get("value")
 
-    def fetch_all_defects(
+        return data.get("TotalResults", 0), last_modified
+
+    def iter_defect_pages(
         self,
         page_size: int = 500,
-        delay: float = 1.0,
         on_page: Callable[[int, int, int], None] | None = None,
-    ) -> dict[str, Any]:
-        """Fetch all defects with pagination.
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw page responses in order until every defect has been fetched.
 
         Args:
             page_size: Number of defects per page.
-            delay: Seconds to wait between requests (be polite).
             on_page: Optional callback(page_num, total_pages, defects_so_far).
 
-        Returns:
-            Combined response with all entities and TotalResults.
+        Yields:
+            Raw API response for each page, with 'entities' and 'TotalResults'.
         """
-        all_entities: list[dict[str, Any]] = []
         start_index = 1
         total_results: int | None = None
+        fetched = 0
         page_num = 0
 
         while True:
@@ -108,7 +257,7 @@ class ALMClient:
             data = self.fetch_defects_page(page_size=page_size, start_index=start_index)
 
             entities = data.get("entities", [])
-            all_entities.extend(entities)
+            fetched += len(entities)
 
             if total_results is None:
                 total_results = data.get("TotalResults", len(entities))
@@ -116,15 +265,150 @@ class ALMClient:
             total_pages = (total_results + page_size - 1) // page_size
 
             if on_page:
-                on_page(page_num, total_pages, len(all_entities))
+                on_page(page_num, total_pages, fetched)
+
+            yield data
 
             # Check if we've fetched everything
-            if len(entities) < page_size or len(all_entities) >= total_results:
-                break
+            if len(entities) < page_size or fetched >= total_results:
+                return
 
-            # Be polite - wait between requests (but not before first request)
             start_index += page_size
-            time.sleep(delay)
+
+    def fetch_defects_iter(
+        self,
+        page_size: int = 500,
+        on_page: Callable[[int, int, int], None] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw defect entities one at a time, fetching pages as needed.
+
+        Only the current page's JSON is held in memory, so a consumer that
+        parses as it goes (see `parse_alm_response_stream`) never materializes
+        the full response.
+
+        Args:
+            page_size: Number of defects per page.
+            on_page: Optional callback(page_num, total_pages, defects_so_far).
+
+        Yields:
+            Raw entity dicts, in ID order.
+        """
+        for data in self.iter_defect_pages(page_size=page_size, on_page=on_page):
+            yield from data.get("entities", [])
+
+    def fetch_all_defects(
+        self,
+        page_size: int = 500,
+        on_page: Callable[[int, int, int], None] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch all defects with pagination.
+
+        Args:
+            page_size: Number of defects per page.
+            on_page: Optional callback(page_num, total_pages, defects_so_far).
+
+        Returns:
+            Combined response with all entities and TotalResults.
+        """
+        all_entities: list[Any] = []
+        total_results: int | None = None
+        filled = 0
+
+        for data in self.iter_defect_pages(page_size=page_size, on_page=on_page):
+            entities = data.get("entities", [])
+            if total_results is None:
+                total_results = data.get("TotalResults", len(entities))
+                # The total is known after page 1, so size the list once
+                # instead of letting it regrow on every page
+                all_entities = [None] * total_results
+            all_entities[filled : filled + len(entities)] = entities
+            filled += len(entities)
+
+        # The server may return fewer defects than it first reported
+        del all_entities[filled:]
+
+        return {
+            "entities": all_entities,
+            "TotalResults": total_results or len(all_entities),
+        }
+
+    async def fetch_all_defects_async(
+        self,
+        page_size: int = 500,
+        concurrency: int = 4,
+        on_page: Callable[[int, int, int], None] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch all defects, requesting the remaining pages concurrently.
+
+        The first page is fetched on its own to learn TotalResults; every other
+        page's start index is then known up front, so those pages are fetched
+        in parallel (at most `concurrency` in flight, started no faster than
+        the client's rate limit allows).
+
+        Args:
+            page_size: Number of defects per page.
+            concurrency: Maximum number of requests in flight.
+            on_page: Optional callback(pages_done, total_pages, defects_so_far),
+                called as each page completes.
+
+        Returns:
+            Combined response with all entities (in ID order) and TotalResults.
+        """
+        path = self._defects_path
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=60.0,
+            follow_redirects=False,
+            limits=httpx.Limits(max_connections=concurrency),
+            transport=self._transport,
+        ) as client:
+
+            async def fetch_page(start_index: int) -> dict[str, Any]:
+                params = self._page_params(page_size, start_index)
+                cache_key = self.cache.key(path, params) if self.cache is not None else None
+                conditional = self._conditional_headers(cache_key)
+
+                async with semaphore:
+                    response = await self._get_async(client, path, params, conditional)
+                    data = self._page_data(response, cache_key)
+                    if data is None:
+                        response = await self._get_async(client, path, params, {})
+                        data = self._page_data(response, cache_key)
+
+                return data or {}
+
+            data = await fetch_page(1)
+            first: list[dict[str, Any]] = data.get("entities", [])
+            total_results: int = data.get("TotalResults", len(first))
+            total_pages = max((total_results + page_size - 1) // page_size, 1)
+
+            pages_done = 1
+            fetched = len(first)
+            if on_page:
+                on_page(pages_done, total_pages, fetched)
+
+            async def fetch_and_report(start_index: int) -> list[dict[str, Any]]:
+                nonlocal pages_done, fetched
+                entities = (await fetch_page(start_index)).get("entities", [])
+                pages_done += 1
+                fetched += len(entities)
+                if on_page:
+                    on_page(pages_done, total_pages, fetched)
+                return entities
+
+            rest: list[list[dict[str, Any]]] = []
+            if len(first) == page_size and total_results > page_size:
+                starts = range(1 + page_size, total_results + 1, page_size)
+                rest = await asyncio.gather(*(fetch_and_report(s) for s in starts))
+
+        all_entities: list[Any] = [None] * (len(first) + sum(map(len, rest)))
+        filled = 0
+        for entities in (first, *rest):
+            all_entities[filled : filled + len(entities)] = entities
+            filled += len(entities)
 
         return {
             "entities": all_entities,
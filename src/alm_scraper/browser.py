@@ -1,24 +1,35 @@
 """Browser cookie extraction for ALM authentication."""
 
-import shutil
-import tempfile
+import functools
+import platform
 from collections.abc import Callable
 from pathlib import Path
 
-import browser_cookie3
 
+@functools.cache
+def _get_browser_configs() -> tuple[tuple[str, str, Path | None], ...]:
+    """Get (name, loader_name, cookie_path) for each browser on this platform.
+
+    loader_name is a browser_cookie3 function, looked up when extraction runs
+    so browser_cookie3 is only imported by `alm config import-browser`.
+    Arc's cookie store only exists on macOS, so it's skipped elsewhere rather
+    than attempted and reported as missing.
+    """
+    browsers: tuple[tuple[str, str, Path | None], ...] = (
+        ("Brave", "brave", None),
+        ("Chrome", "chrome", None),
+        ("Edge", "edge", None),
+        ("Firefox", "firefox", None),
+    )
+    if platform.system() != "Darwin":
+        return browsers
 
-def _get_browser_configs() -> list[tuple[str, Callable, Path | None]]:
-    """Get list of (name, loader_func, cookie_path) for each browser."""
     arc_base = Path.home() / "Library/Application Support/Arc/User Data"
-    return [
-        ("Arc (Profile 1)", browser_cookie3.arc, arc_base / "Profile 1" / "Cookies"),
-        ("Arc (Default)", browser_cookie3.arc, arc_base / "Default" / "Cookies"),
-        ("Brave", browser_cookie3.brave, None),
-        ("Chrome", browser_cookie3.chrome, None),
-        ("Edge", browser_cookie3.edge, None),
-        ("Firefox", browser_cookie3.firefox, None),
-    ]
+    return (
+        ("Arc (Profile 1)", "arc", arc_base / "Profile 1" / "Cookies"),
+        ("Arc (Default)", "arc", arc_base / "Default" / "Cookies"),
+        *browsers,
+    )
 
 
 def extract_cookies(
@@ -39,12 +50,15 @@ def extract_cookies(
     Raises:
         RuntimeError: No cookies found in any browser
     """
+    import browser_cookie3
+
     browsers = _get_browser_configs()
 
     if browser:
         browsers = [(n, f, p) for n, f, p in browsers if browser.lower() in n.lower()]
 
-    for name, loader, cookie_path in browsers:
+    for name, loader_name, cookie_path in browsers:
+        loader = getattr(browser_cookie3, loader_name)
         if cookie_path and not cookie_path.exists():
             if on_status:
                 on_status(name, "not installed")
@@ -52,14 +66,10 @@ def extract_cookies(
 
         try:
             if cookie_path:
-                # Copy to temp to avoid locking
-                with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-                    tmp_path = Path(tmp.name)
-                shutil.copy(cookie_path, tmp_path)
-                try:
-                    cj = loader(cookie_file=str(tmp_path), domain_name=domain)
-                finally:
-                    tmp_path.unlink(missing_ok=True)
+                # browser_cookie3 opens the DB read-only (then nolock, then
+                # immutable) and only falls back to a temp copy itself if the
+                # browser's lock still blocks it, so no up-front copy is needed
+                cj = loader(cookie_file=str(cookie_path), domain_name=domain)
             else:
                 cj = loader(domain_name=domain)
 
@@ -1,30 +1,52 @@
-import json
+import functools
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import httpx
-from rich.console import Console
-
-from alm_scraper.api import ALMClient
-from alm_scraper.config import Config, get_config_path, load_config, save_config
-from alm_scraper.curl_parser import parse_curl
-from alm_scraper.db import count_defects, get_db_path, get_defect_by_id, get_stats, list_defects
-from alm_scraper.defect import parse_alm_response
-from alm_scraper.display import (
-    format_defect,
-    format_defect_json,
-    format_defect_markdown,
-    format_defect_table,
-    format_defects_json,
-    format_defects_markdown,
-    format_stats,
-    format_stats_json,
-)
-from alm_scraper.query import execute_query, get_schema_help
-from alm_scraper.storage import sync_defects
 
-err = Console(stderr=True)
+# Heavier modules (rich, httpx, pydantic, sqlite, ...) are imported inside the
+# commands that need them, so `alm --help` and `alm config path` start fast.
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+
+    import httpx
+    from rich.console import Console
+
+
+@functools.cache
+def _err() -> "Console":
+    """Get the shared stderr console, creating it on first use."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+def _emit(payload: str | bytes) -> None:
+    """Write command output to stdout in one buffered write.
+
+    Large JSON/markdown dumps go straight to the binary stream with their
+    trailing newline, skipping print's per-call text encoding and flushes.
+    """
+    if isinstance(payload, str):
+        payload = payload.encode()
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _event_loop_factory() -> "Callable[[], asyncio.AbstractEventLoop] | None":
+    """Get uvloop's loop factory if the optional 'fast' extra is installed.
+
+    Returns None (asyncio's default loop) otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
 
 # Hardcoded ALM config - same for all team members
 ALM_BASE_URL = "https://alm.deloitte.com/qcbin"
@@ -37,46 +59,56 @@ ALM_LOGIN_URL = (
 )
 
 
-def require_db() -> None:
-    """Exit with error if database doesn't exist."""
-    db_path = get_db_path()
-    if not db_path.exists():
-        err.print("[red]Error: No defects synced yet.[/red]")
-        err.print()
-        err.print("Run 'alm sync' or 'alm sync-file <file>' first.")
-        sys.exit(1)
+def requires_db[**P](command: "Callable[P, None]") -> "Callable[P, None]":
+    """Decorate a command to exit with an error if no database has been synced.
+
+    The check runs once, before the command body and its own imports.
+    """
+
+    @functools.wraps(command)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
+        from alm_scraper.db import get_db_path
+
+        if not get_db_path().exists():
+            _err().print("[red]Error: No defects synced yet.[/red]")
+            _err().print()
+            _err().print("Run 'alm sync' or 'alm sync-file <file>' first.")
+            sys.exit(1)
+        command(*args, **kwargs)
 
+    return wrapper
 
-def _is_oauth_redirect(response: httpx.Response) -> bool:
+
+def _is_oauth_redirect(response: "httpx.Response") -> bool:
     """Check if response is an OAuth redirect (session expired)."""
     if response.status_code not in (301, 302, 303, 307, 308):
         return False
-    location = response.headers.get("location", "")
-    return "oauth2" in location or "auth" in location
+    # "auth" also matches "oauth2", so one substring scan covers both
+    return "auth" in response.headers.get("location", "")
 
 
-def _handle_http_error(e: httpx.HTTPStatusError) -> None:
+def _handle_http_error(e: "httpx.HTTPStatusError") -> None:
     """Handle HTTP errors with helpful messages."""
     response = e.response
 
     if _is_oauth_redirect(response):
-        err.print("[red]Error: Session expired - OAuth re-authentication required[/red]")
-        err.print()
-        err.print("Try auto-extracting cookies from your browser:")
-        err.print("  [bold]alm config import-browser[/bold]")
-        err.print("  [dim](first run will prompt for Keychain access)[/dim]")
-        err.print()
-        err.print("If that doesn't work, log into ALM first:")
-        err.print(f"  {ALM_LOGIN_URL}")
+        _err().print("[red]Error: Session expired - OAuth re-authentication required[/red]")
+        _err().print()
+        _err().print("Try auto-extracting cookies from your browser:")
+        _err().print("  [bold]alm config import-browser[/bold]")
+        _err().print("  [dim](first run will prompt for Keychain access)[/dim]")
+        _err().print()
+        _err().print("If that doesn't work, log into ALM first:")
+        _err().print(f"  {ALM_LOGIN_URL}")
     elif response.status_code in (401, 403):
-        err.print(f"[red]Error: HTTP {response.status_code} - Authentication failed[/red]")
-        err.print()
-        err.print("Your session may have expired. To refresh:")
-        err.print("  1. Log into ALM in your browser")
-        err.print("  2. Copy a request as cURL from DevTools")
-        err.print("  3. Run: [bold]alm config import-curl[/bold]")
+        _err().print(f"[red]Error: HTTP {response.status_code} - Authentication failed[/red]")
+        _err().print()
+        _err().print("Your session may have expired. To refresh:")
+        _err().print("  1. Log into ALM in your browser")
+        _err().print("  2. Copy a request as cURL from DevTools")
+        _err().print("  3. Run: [bold]alm config import-curl[/bold]")
     else:
-        err.print(f"[red]Error: HTTP {response.status_code}[/red]")
+        _err().print(f"[red]Error: HTTP {response.status_code}[/red]")
 
     sys.exit(1)
 
@@ -97,14 +129,18 @@ def main() -> None:
     default="rich",
     help="Output format (default: rich)",
 )
+@requires_db
 def show(defect_id: int, output_format: str) -> None:
     """Show details for a specific defect by ID."""
-    require_db()
+    from rich.console import Console
+
+    from alm_scraper.db import get_defect_by_id
+    from alm_scraper.display import format_defect, format_defect_json, format_defect_markdown
 
     defect = get_defect_by_id(defect_id)
 
     if defect is None:
-        err.print(f"[red]Error: Defect #{defect_id} not found[/red]")
+        _err().print(f"[red]Error: Defect #{defect_id} not found[/red]")
         sys.exit(1)
         return  # help type checker
 
@@ -112,9 +148,9 @@ def show(defect_id: int, output_format: str) -> None:
         out = Console()
         format_defect(defect, out)
     elif output_format in ("markdown", "md"):
-        print(format_defect_markdown(defect))
+        _emit(format_defect_markdown(defect))
     elif output_format == "json":
-        print(format_defect_json(defect))
+        _emit(format_defect_json(defect))
 
 
 @main.command("list")
@@ -134,6 +170,7 @@ def show(defect_id: int, output_format: str) -> None:
     default="table",
     help="Output format [default: table]",
 )
+@requires_db
 def list_cmd(
     status: tuple[str, ...],
     owner: tuple[str, ...],
@@ -149,7 +186,14 @@ def list_cmd(
 
     By default, only open defects are shown. Use --status to override.
     """
-    require_db()
+    from rich.console import Console
+
+    from alm_scraper.db import count_defects, list_defects
+    from alm_scraper.display import (
+        format_defect_table,
+        format_defects_json_bytes,
+        format_defects_markdown,
+    )
 
     effective_limit = None if show_all else limit
 
@@ -172,28 +216,32 @@ def list_cmd(
         out = Console()
         format_defect_table(defects, out, total_count=total)
     elif output_format in ("markdown", "md"):
-        print(format_defects_markdown(defects))
+        _emit(format_defects_markdown(defects))
     elif output_format == "json":
-        print(format_defects_json(defects))
+        _emit(format_defects_json_bytes(defects))
 
 
 @main.command()
 @click.option("--all", "include_closed", is_flag=True, help="Include closed defects in breakdowns")
 @click.option("--top", "top_n", default=5, help="Number of items in each breakdown [default: 5]")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@requires_db
 def stats(include_closed: bool, top_n: int, as_json: bool) -> None:
     """Show aggregate statistics about defects."""
-    require_db()
+    from rich.console import Console
+
+    from alm_scraper.db import get_stats
+    from alm_scraper.display import format_stats, format_stats_json
 
     stats_data = get_stats(include_closed=include_closed, top_n=top_n)
 
     if stats_data is None:
-        err.print("[red]Error: Could not load stats.[/red]")
+        _err().print("[red]Error: Could not load stats.[/red]")
         sys.exit(1)
         return  # help type checker
 
     if as_json:
-        print(format_stats_json(stats_data))
+        _emit(format_stats_json(stats_data))
     else:
         out = Console()
         format_stats(stats_data, out, include_closed=include_closed, top_n=top_n)
@@ -204,6 +252,8 @@ class QueryHelpCommand(click.Command):
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """Override to append schema documentation to help."""
+        from alm_scraper.query import get_schema_help
+
         super().format_help(ctx, formatter)
         formatter.write("\n")
         formatter.write(get_schema_help())
@@ -220,84 +270,160 @@ def query(sql: str | None, as_csv: bool, as_json: bool) -> None:
     """
     import sqlite3
 
+    from alm_scraper.query import execute_query
+
     # Read from stdin if no argument provided
     if sql is None:
         if sys.stdin.isatty():
-            err.print("[red]Error: No SQL provided.[/red]")
-            err.print()
-            err.print('Usage: alm query "SELECT ..."')
-            err.print('   or: echo "SELECT ..." | alm query')
+            _err().print("[red]Error: No SQL provided.[/red]")
+            _err().print()
+            _err().print('Usage: alm query "SELECT ..."')
+            _err().print('   or: echo "SELECT ..." | alm query')
             sys.exit(1)
         sql = sys.stdin.read().strip()
         if not sql:
-            err.print("[red]Error: No SQL provided.[/red]")
+            _err().print("[red]Error: No SQL provided.[/red]")
             sys.exit(1)
 
+    # Only the aligned table needs every row up front; the other formats are
+    # written as rows are read from the cursor
+    as_table = not (as_json or as_csv) and sys.stdout.isatty()
     try:
-        result = execute_query(sql)
+        result = execute_query(sql, stream=not as_table)
     except FileNotFoundError:
-        err.print("[red]Error: No defects synced yet.[/red]")
-        err.print()
-        err.print("Run 'alm sync' or 'alm sync-file <file>' first.")
+        _err().print("[red]Error: No defects synced yet.[/red]")
+        _err().print()
+        _err().print("Run 'alm sync' or 'alm sync-file <file>' first.")
         sys.exit(1)
     except ValueError as e:
-        err.print(f"[red]Error: {e}[/red]")
+        _err().print(f"[red]Error: {e}[/red]")
         sys.exit(1)
     except sqlite3.Error as e:
-        err.print(f"[red]SQL Error: {e}[/red]")
+        _err().print(f"[red]SQL Error: {e}[/red]")
         sys.exit(1)
 
-    if as_json:
-        print(result.to_json())
-    elif as_csv:
-        print(result.to_csv())
-    else:
-        print(result.to_table())
+    # Streamed rows are still being read from SQLite here, so a query can
+    # fail after the first rows have been written
+    try:
+        if as_table:
+            _emit(result.to_table())
+        elif as_json:
+            sys.stdout.flush()
+            result.write_json(sys.stdout.buffer)
+            sys.stdout.buffer.write(b"\n")
+        else:
+            # Piped without a format: plain TSV skips the column-width pass
+            result.write_csv(sys.stdout, tsv=not as_csv)
+            if as_csv:
+                sys.stdout.write("\n")
+    except sqlite3.Error as e:
+        sys.stdout.flush()
+        _err().print(f"[red]SQL Error: {e}[/red]")
+        sys.exit(1)
 
 
 @main.command()
 @click.option("--debug", is_flag=True, help="Print request/response debug info")
-def sync(debug: bool) -> None:
+@click.option(
+    "-c",
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Pages to fetch in parallel, 1 to fetch sequentially [default: 4]",
+)
+@click.option(
+    "--rate",
+    default=1.0,
+    type=click.FloatRange(min=0),
+    help="Max requests per second, 0 for no limit [default: 1.0]",
+)
+@click.option("--no-cache", is_flag=True, help="Re-download every page, ignoring the page cache")
+@click.option("--force", is_flag=True, help="Sync even if nothing changed since the last sync")
+def sync(debug: bool, concurrency: int, rate: float, no_cache: bool, force: bool) -> None:
     """Sync defects from ALM to local storage."""
+    import asyncio
+
+    import httpx
+    from rich.progress import Progress
+
+    from alm_scraper.api import ALMClient
+    from alm_scraper.config import load_config
+    from alm_scraper.defect import parse_alm_response, parse_alm_response_stream
+    from alm_scraper.page_cache import PageCache
+    from alm_scraper.storage import read_sync_meta, sync_defects
+
     config = load_config()
 
     if config is None:
-        err.print("[red]Error: No configuration found.[/red]")
-        err.print()
-        err.print("Log into ALM in your browser, then run:")
-        err.print("  [bold]alm config import-browser[/bold]")
-        err.print("  [dim](first run will prompt for Keychain access)[/dim]")
-        err.print()
-        err.print("If that doesn't work, log into ALM first:")
-        err.print(f"  {ALM_LOGIN_URL}")
+        _err().print("[red]Error: No configuration found.[/red]")
+        _err().print()
+        _err().print("Log into ALM in your browser, then run:")
+        _err().print("  [bold]alm config import-browser[/bold]")
+        _err().print("  [dim](first run will prompt for Keychain access)[/dim]")
+        _err().print()
+        _err().print("If that doesn't work, log into ALM first:")
+        _err().print(f"  {ALM_LOGIN_URL}")
         sys.exit(1)
         return  # help type checker
 
-    err.print(f"Fetching defects from {config.base_url}...")
-
-    client = ALMClient(config, debug=debug)
-
-    def on_page(page: int, total: int, count: int) -> None:
-        err.print(f"  Page {page}/{total}: {count} defects")
+    _err().print(f"Fetching defects from {config.base_url}...")
 
     try:
-        data = client.fetch_all_defects(on_page=on_page)
+        cache = None if no_cache else PageCache()
+        with ALMClient(config, debug=debug, cache=cache, rate=rate) as client:
+            meta = None if force else read_sync_meta()
+            if meta is not None:
+                # One tiny request tells us whether any defect was added,
+                # removed, or modified since the last sync
+                total, last_modified = client.fetch_defects_summary()
+                if meta.is_current(total, last_modified):
+                    _err().print(f"[green]Already up to date ({total} defects)[/green]")
+                    _err().print("[dim]Use --force to sync anyway.[/dim]")
+                    return
+
+            # On a terminal, a live progress bar re-renders at a capped rate
+            # however fast pages arrive. Piped/CI stderr keeps one line per page.
+            interactive = _err().is_terminal
+            with Progress(console=_err(), transient=True, disable=not interactive) as progress:
+                task = progress.add_task("Fetching pages", total=None)
+
+                def on_page(page: int, total: int, count: int) -> None:
+                    if not interactive:
+                        _err().print(f"  Page {page}/{total}: {count} defects")
+                        return
+                    progress.update(
+                        task,
+                        description=f"Page {page}/{total}: {count} defects",
+                        completed=page,
+                        total=total,
+                    )
+
+                if concurrency > 1:
+                    data = asyncio.run(
+                        client.fetch_all_defects_async(concurrency=concurrency, on_page=on_page),
+                        loop_factory=_event_loop_factory(),
+                    )
+                    defects = parse_alm_response(data)
+                else:
+                    # Parse each page as it arrives so only one page of raw JSON is held
+                    defects = list(
+                        parse_alm_response_stream(client.fetch_defects_iter(on_page=on_page))
+                    )
     except httpx.HTTPStatusError as e:
         _handle_http_error(e)
     except httpx.RequestError as e:
-        err.print(f"[red]Error: {e}[/red]")
+        _err().print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
-    err.print("Parsing defects...")
-    defects = parse_alm_response(data)
+    _err().print(f"  Fetched {len(defects)} defects")
 
-    err.print("Syncing to local storage...")
+    _err().print("Syncing to local storage...")
     result = sync_defects(defects)
 
-    err.print()
-    err.print(f"[green]Synced {result.defect_count} defects[/green]")
-    err.print(f"  {result.data_dir / result.history_base}.json")
-    err.print(f"  {result.data_dir / result.history_base}.db")
+    _err().print()
+    _err().print(f"[green]Synced {result.defect_count} defects[/green]")
+    _err().print(f"  {result.data_dir / result.history_base}.json")
+    _err().print(f"  {result.data_dir / result.history_base}.db")
 
 
 @main.command("sync-file")
@@ -308,22 +434,26 @@ def sync_file(file: Path) -> None:
     This is useful for testing the sync pipeline without hitting the network.
     The file should be a raw ALM API response with an 'entities' array.
     """
-    err.print(f"Reading {file}...")
+    import orjson
+
+    from alm_scraper.defect import parse_alm_response
+    from alm_scraper.storage import sync_defects
+
+    _err().print(f"Reading {file}...")
 
-    with file.open() as f:
-        data = json.load(f)
+    data = orjson.loads(file.read_bytes())
 
-    err.print("Parsing defects...")
+    _err().print("Parsing defects...")
     defects = parse_alm_response(data)
-    err.print(f"  Found {len(defects)} defects")
+    _err().print(f"  Found {len(defects)} defects")
 
-    err.print("Syncing to local storage...")
+    _err().print("Syncing to local storage...")
     result = sync_defects(defects)
 
-    err.print()
-    err.print(f"[green]Synced {result.defect_count} defects[/green]")
-    err.print(f"  {result.data_dir / result.history_base}.json")
-    err.print(f"  {result.data_dir / result.history_base}.db")
+    _err().print()
+    _err().print(f"[green]Synced {result.defect_count} defects[/green]")
+    _err().print(f"  {result.data_dir / result.history_base}.json")
+    _err().print(f"  {result.data_dir / result.history_base}.db")
 
 
 @main.group()
@@ -340,42 +470,24 @@ def import_curl() -> None:
 
     Can also be piped: pbpaste | alm config import-curl
     """
-    if sys.stdin.isatty():
-        # Interactive mode - prompt for input
-        err.print("Paste curl command (press Enter twice when done):")
-        err.print()
-
-        lines: list[str] = []
-        empty_count = 0
-
-        while empty_count < 1:
-            try:
-                line = input()
-                if not line:
-                    empty_count += 1
-                else:
-                    empty_count = 0
-                    lines.append(line)
-            except EOFError:
-                break
+    from alm_scraper.config import Config, save_config
+    from alm_scraper.curl_parser import parse_curl
 
-        if not lines:
-            err.print("[red]Error: No input provided[/red]")
-            sys.exit(1)
+    if sys.stdin.isatty():
+        # Interactive mode - prompt, then read the whole paste in one go
+        _err().print("Paste curl command, then press Ctrl-D when done:")
+        _err().print()
 
-        curl_command = "\n".join(lines)
-    else:
-        # Piped input - read all at once
-        curl_command = sys.stdin.read().strip()
+    curl_command = sys.stdin.read().strip()
 
-        if not curl_command:
-            err.print("[red]Error: No input provided[/red]")
-            sys.exit(1)
+    if not curl_command:
+        _err().print("[red]Error: No input provided[/red]")
+        sys.exit(1)
 
     try:
         parsed = parse_curl(curl_command)
     except ValueError as e:
-        err.print(f"[red]Error: {e}[/red]")
+        _err().print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
     config_obj = Config(
@@ -387,14 +499,14 @@ def import_curl() -> None:
 
     path = save_config(config_obj)
 
-    err.print()
-    err.print("[green]Imported config:[/green]")
-    err.print(f"  base_url: {config_obj.base_url}")
-    err.print(f"  domain:   {config_obj.domain}")
-    err.print(f"  project:  {config_obj.project}")
-    err.print(f"  cookies:  {len(config_obj.cookies)} cookies extracted")
-    err.print()
-    err.print(f"[green]Saved to {path}[/green]")
+    _err().print()
+    _err().print("[green]Imported config:[/green]")
+    _err().print(f"  base_url: {config_obj.base_url}")
+    _err().print(f"  domain:   {config_obj.domain}")
+    _err().print(f"  project:  {config_obj.project}")
+    _err().print(f"  cookies:  {len(config_obj.cookies)} cookies extracted")
+    _err().print()
+    _err().print(f"[green]Saved to {path}[/green]")
 
 
 @config.command("import-browser")
@@ -410,26 +522,27 @@ def import_browser(browser: str | None) -> None:
     Uses the first browser that has valid cookies.
     """
     from alm_scraper.browser import extract_cookies
+    from alm_scraper.config import Config, save_config
 
-    err.print("Searching for ALM cookies...")
-    err.print("[dim]Note: First run may prompt for Keychain access.[/dim]")
-    err.print()
+    _err().print("Searching for ALM cookies...")
+    _err().print("[dim]Note: First run may prompt for Keychain access.[/dim]")
+    _err().print()
 
     def on_status(name: str, status: str) -> None:
-        err.print(f"  {name}: {status}")
+        _err().print(f"  {name}: {status}")
 
     try:
         browser_name, cookies = extract_cookies(
             ALM_COOKIE_DOMAIN, browser=browser, on_status=on_status
         )
     except RuntimeError as e:
-        err.print()
-        err.print(f"[red]Error: {e}[/red]")
-        err.print()
-        err.print("Log into ALM in Arc, Brave, Chrome, Edge, or Firefox:")
-        err.print(f"  {ALM_LOGIN_URL}")
-        err.print()
-        err.print("Then run 'alm config import-browser' again.")
+        _err().print()
+        _err().print(f"[red]Error: {e}[/red]")
+        _err().print()
+        _err().print("Log into ALM in Arc, Brave, Chrome, Edge, or Firefox:")
+        _err().print(f"  {ALM_LOGIN_URL}")
+        _err().print()
+        _err().print("Then run 'alm config import-browser' again.")
         sys.exit(1)
 
     new_config = Config(
@@ -441,33 +554,37 @@ def import_browser(browser: str | None) -> None:
 
     path = save_config(new_config)
 
-    err.print()
-    err.print(f"[green]Imported {len(cookies)} cookies from {browser_name}[/green]")
-    err.print(f"  base_url: {new_config.base_url}")
-    err.print(f"  domain:   {new_config.domain}")
-    err.print(f"  project:  {new_config.project}")
-    err.print()
-    err.print(f"[green]Saved to {path}[/green]")
+    _err().print()
+    _err().print(f"[green]Imported {len(cookies)} cookies from {browser_name}[/green]")
+    _err().print(f"  base_url: {new_config.base_url}")
+    _err().print(f"  domain:   {new_config.domain}")
+    _err().print(f"  project:  {new_config.project}")
+    _err().print()
+    _err().print(f"[green]Saved to {path}[/green]")
 
 
 @config.command("show")
 def config_show() -> None:
     """Show current configuration."""
+    from alm_scraper.config import get_config_path
+
     path = get_config_path()
 
     if not path.exists():
-        err.print(f"[yellow]No config file found at {path}[/yellow]")
-        err.print()
-        err.print("Run 'alm config import-curl' to create one.")
+        _err().print(f"[yellow]No config file found at {path}[/yellow]")
+        _err().print()
+        _err().print("Run 'alm config import-curl' to create one.")
         sys.exit(1)
 
     with path.open() as f:
-        err.print(f.read())
+        _err().print(f.read())
 
 
 @config.command("path")
 def config_path() -> None:
     """Show path to configuration file."""
+    from alm_scraper.config import get_config_path
+
     print(get_config_path())
 
 
@@ -475,10 +592,9 @@ def config_path() -> None:
 @click.option("--port", default=8753, help="Port to run on")
 @click.option("--no-open", is_flag=True, help="Don't open browser automatically")
 @click.option("--reload", is_flag=True, help="Auto-reload when UI files change")
+@requires_db
 def ui(port: int, no_open: bool, reload: bool) -> None:
     """Launch local web UI for browsing defects."""
-    require_db()
-
     import threading
     import time
     import webbrowser
@@ -496,11 +612,11 @@ def ui(port: int, no_open: bool, reload: bool) -> None:
 
         threading.Thread(target=open_browser, daemon=True).start()
 
-    err.print(f"Starting ALM UI at {url}")
+    _err().print(f"Starting ALM UI at {url}")
     if reload:
-        err.print("[dim]Watching for changes (rebuild UI with 'make build-ui')[/dim]")
-    err.print("Press Ctrl+C to stop")
-    err.print()
+        _err().print("[dim]Watching for changes (rebuild UI with 'make build-ui')[/dim]")
+    _err().print("Press Ctrl+C to stop")
+    _err().print()
 
     # Get paths for reload watching
     reload_dirs: list[str] = []
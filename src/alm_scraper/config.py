@@ -1,20 +1,51 @@
 """Configuration management for alm-scraper."""
 
+import dataclasses
 import json
+import types
+from collections.abc import Mapping
 from pathlib import Path
-
-from pydantic import BaseModel
+from typing import Any
 
 from alm_scraper.utils import write_json
 
 
-class Config(BaseModel):
+# Immutable (cookies included) so a cached instance can be shared between callers
+@dataclasses.dataclass(slots=True, frozen=True)
+class Config:
     """ALM scraper configuration."""
 
     base_url: str
     domain: str
     project: str
-    cookies: dict[str, str]
+    cookies: Mapping[str, str]
+
+    def __post_init__(self) -> None:
+        # Store a read-only copy, so no caller can change the shared cookies
+        object.__setattr__(self, "cookies", types.MappingProxyType(dict(self.cookies)))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Config":
+        """Build a Config from parsed JSON, checking field types.
+
+        Unknown keys are ignored.
+
+        Raises:
+            ValueError: If a field is missing or has the wrong type.
+        """
+        try:
+            base_url, domain, project = data["base_url"], data["domain"], data["project"]
+            cookies = data["cookies"]
+        except KeyError as e:
+            raise ValueError(f"Config is missing '{e.args[0]}'") from None
+
+        if not all(isinstance(v, str) for v in (base_url, domain, project)):
+            raise ValueError("Config base_url, domain and project must be strings")
+        if not isinstance(cookies, dict) or not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()
+        ):
+            raise ValueError("Config cookies must map names to string values")
+        return cls(base_url=base_url, domain=domain, project=project, cookies=cookies)
 
 
 def get_config_dir() -> Path:
@@ -27,20 +58,34 @@ def get_config_path() -> Path:
     return get_config_dir() / "config.json"
 
 
+# Last loaded config, keyed by the file's mtime
+_config_cache: tuple[int, Config] | None = None
+
+
 def load_config() -> Config | None:
     """Load configuration from file.
 
+    The parsed config is cached until the file's mtime changes, so repeated
+    calls (e.g. from the UI server) only cost a stat.
+
     Returns:
         Config if file exists and is valid, None otherwise.
     """
+    global _config_cache
+
     path = get_config_path()
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
 
-    with path.open() as f:
-        data = json.load(f)
+    if _config_cache is not None and _config_cache[0] == mtime_ns:
+        return _config_cache[1]
 
-    return Config.model_validate(data)
+    data = json.loads(path.read_bytes())
+    config = Config.from_dict(data)
+    _config_cache = (mtime_ns, config)
+    return config
 
 
 def save_config(config: Config) -> Path:
@@ -53,5 +98,13 @@ def save_config(config: Config) -> Path:
         Path to the saved configuration file.
     """
     path = get_config_path()
-    write_json(path, config.model_dump())
+    write_json(
+        path,
+        {
+            "base_url": config.base_url,
+            "domain": config.domain,
+            "project": config.project,
+            "cookies": dict(config.cookies),
+        },
+    )
     return path
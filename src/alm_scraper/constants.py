@@ -62,4 +62,4 @@ def format_convergint_owner(owner_raw: str) -> str:
     Returns:
         Formatted name like "John Doe"
     """
-    return owner_raw.replace("_convergint.com", "").replace(".", " ").title()
+    return owner_raw.removesuffix("_convergint.com").replace(".", " ").title()
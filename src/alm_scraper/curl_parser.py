@@ -1,10 +1,18 @@
 """Parse curl commands to extract URL, cookies, and headers."""
 
 import re
-import shlex
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
+# ALM REST paths look like /qcbin/rest/domains/{domain}/projects/{project}/...
+_DOMAIN_PROJECT_PATTERN = re.compile(r"/domains/([^/]+)/projects/([^/]+)")
+
+# Characters with special meaning to the shell word splitter
+_SPECIAL_CHAR_PATTERN = re.compile(r"[ \t\r\n'\"\\]")
+
+# One "name=value" cookie; parts without "=" are skipped
+_COOKIE_PATTERN = re.compile(r"([^;=]*)=([^;]*)")
+
 
 @dataclass
 class CurlConfig:
@@ -16,6 +24,71 @@ class CurlConfig:
     cookies: dict[str, str]
 
 
+def _split_words(command: str) -> list[str]:
+    """Split a command into words using POSIX shell quoting rules.
+
+    Handles the quoting a browser's "Copy as cURL" produces: single quotes,
+    double quotes (where backslash escapes only " and \\), and backslash
+    escapes outside quotes. Produces the same words as `shlex.split`.
+
+    Raises:
+        ValueError: If a quote is unterminated or the command ends in a backslash.
+    """
+    words: list[str] = []
+    word: list[str] = []
+    in_word = False
+    i = 0
+    n = len(command)
+
+    while i < n:
+        char = command[i]
+        if char in " \t\r\n":
+            if in_word:
+                words.append("".join(word))
+                word = []
+                in_word = False
+            i += 1
+            continue
+
+        in_word = True
+        if char == "'":
+            end = command.find("'", i + 1)
+            if end < 0:
+                raise ValueError("No closing quotation")
+            word.append(command[i + 1 : end])
+            i = end + 1
+        elif char == '"':
+            i += 1
+            while True:
+                if i >= n:
+                    raise ValueError("No closing quotation")
+                char = command[i]
+                if char == '"':
+                    i += 1
+                    break
+                if char == "\\" and i + 1 < n and command[i + 1] in '"\\':
+                    word.append(command[i + 1])
+                    i += 2
+                else:
+                    word.append(char)
+                    i += 1
+        elif char == "\\":
+            if i + 1 >= n:
+                raise ValueError("No escaped character")
+            word.append(command[i + 1])
+            i += 2
+        else:
+            # Copy everything up to the next special character in one slice
+            special = _SPECIAL_CHAR_PATTERN.search(command, i)
+            end = special.start() if special else n
+            word.append(command[i:end])
+            i = end
+
+    if in_word:
+        words.append("".join(word))
+    return words
+
+
 def parse_curl(curl_command: str) -> CurlConfig:
     """Parse a curl command and extract ALM configuration.
 
@@ -31,9 +104,9 @@ def parse_curl(curl_command: str) -> CurlConfig:
     # Normalize the command - handle multi-line and escape sequences
     normalized = curl_command.replace("\\\n", " ").replace("\n", " ")
 
-    # Use shlex to properly parse the command with quotes
+    # Split into words, respecting quotes
     try:
-        tokens = shlex.split(normalized)
+        tokens = _split_words(normalized)
     except ValueError as e:
         raise ValueError(f"Failed to parse curl command: {e}") from e
 
@@ -81,7 +154,7 @@ def parse_curl(curl_command: str) -> CurlConfig:
 
     # Extract domain and project from path
     # Pattern: /qcbin/rest/domains/{domain}/projects/{project}/...
-    path_match = re.search(r"/domains/([^/]+)/projects/([^/]+)", parsed.path)
+    path_match = _DOMAIN_PROJECT_PATTERN.search(parsed.path)
     if path_match:
         domain = path_match.group(1)
         project = path_match.group(2)
@@ -108,16 +181,5 @@ def parse_cookies(cookie_str: str) -> dict[str, str]:
     Returns:
         Dictionary mapping cookie names to values.
     """
-    cookies: dict[str, str] = {}
-
-    for part in cookie_str.split(";"):
-        part = part.strip()
-        if not part:
-            continue
-
-        # Split on first = only (values can contain =)
-        if "=" in part:
-            name, value = part.split("=", 1)
-            cookies[name.strip()] = value.strip()
-
-    return cookies
+    # Values can contain "=", so only the first one in each part splits
+    return {name.strip(): value.strip() for name, value in _COOKIE_PATTERN.findall(cookie_str)}
@@ -1,13 +1,16 @@
 """Database access for defect queries."""
 
+import functools
+import json
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 
 from alm_scraper.constants import TERMINAL_STATUSES
 from alm_scraper.defect import Defect
-from alm_scraper.sql_helpers import terminal_status_filter
+from alm_scraper.sql_helpers import priority_sort_case_sql, terminal_status_filter
 from alm_scraper.storage import get_data_dir
 
 
@@ -16,14 +19,71 @@ def get_db_path() -> Path:
     return get_data_dir() / "defects.db"
 
 
+# Each thread's open read connection, keyed by the file it points at. The UI
+# serves requests from a thread pool, so connections aren't shared between
+# threads.
+_local = threading.local()
+
+
+def _db_file_key(db_path: Path) -> tuple[str, int, int]:
+    """Identify the database file db_path currently points at.
+
+    Returns the resolved path, inode and mtime, which change whenever a sync
+    repoints the defects.db symlink or the file is rebuilt in place.
+
+    Raises:
+        FileNotFoundError: If database doesn't exist.
+    """
+    real_path = db_path.resolve()
+    st = real_path.stat()
+    return str(real_path), st.st_ino, st.st_mtime_ns
+
+
+def _get_cached_connection(db_path: Path) -> sqlite3.Connection:
+    """Get this thread's reusable read-only connection to the database at db_path.
+
+    Reusing one connection keeps SQLite's page cache and Python's prepared
+    statement cache warm across queries. The cache is keyed by
+    `_db_file_key`, so once a sync repoints the defects.db symlink (or
+    rebuilds the file in place) the old connection is closed and a new one
+    opened.
+    """
+    key = _db_file_key(db_path)
+    cached: tuple[tuple[str, int, int], sqlite3.Connection] | None = getattr(_local, "conn", None)
+    if cached is not None:
+        cached_key, conn = cached
+        if cached_key == key:
+            return conn
+        conn.close()
+
+    # mode=ro opens the file read-only, so SQLite never takes a write lock or
+    # creates a journal for it
+    conn = sqlite3.connect(
+        f"{Path(key[0]).as_uri()}?mode=ro",
+        uri=True,
+        cached_statements=256,
+        isolation_level=None,
+    )
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA cache_size = -65536")
+    _local.conn = (key, conn)
+    return conn
+
+
 @contextmanager
 def get_connection(
-    row_factory: bool = True,
+    row_factory: bool = False,
 ) -> Generator[sqlite3.Connection]:
     """Context manager for database connections.
 
+    The connection is read-only and per-thread; it stays open after the
+    block exits so later queries on the same thread can reuse it.
+
     Args:
-        row_factory: If True, use sqlite3.Row for dict-like access.
+        row_factory: If True, use sqlite3.Row for dict-like access. Off by
+            default; rows are plain tuples, which are cheaper to build and
+            index by position.
 
     Yields:
         Database connection.
@@ -32,42 +92,54 @@ def get_connection(
         FileNotFoundError: If database doesn't exist.
     """
     db_path = get_db_path()
-    if not db_path.exists():
-        raise FileNotFoundError(f"Database not found: {db_path}")
-
-    conn = sqlite3.connect(db_path)
-    if row_factory:
-        conn.row_factory = sqlite3.Row
     try:
-        yield conn
-    finally:
-        conn.close()
+        conn = _get_cached_connection(db_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Database not found: {db_path}") from None
+    conn.row_factory = sqlite3.Row if row_factory else None
+    yield conn
 
 
 def _add_exact_filter(
     conditions: list[str],
-    params: list[str],
+    params: list[str | int],
     field: str,
-    values: tuple[str, ...],
+    values: tuple[str, ...] | None,
 ) -> None:
-    """Add exact match filter (case-insensitive IN clause)."""
+    """Add exact match filter (case-insensitive IN clause).
+
+    Values are bound as one JSON array, so the SQL text doesn't depend on how
+    many values are given and the prepared statement can be reused. Comparing
+    with COLLATE NOCASE (rather than LOWER()) lets SQLite seek the column's
+    NOCASE index instead of scanning, and means values needn't be lowercased.
+    """
     if values:
-        placeholders = ",".join("?" * len(values))
-        conditions.append(f"LOWER({field}) IN ({placeholders})")
-        params.extend(v.lower() for v in values)
+        conditions.append(f"{field} COLLATE NOCASE IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(values))
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so `value` matches literally (with ESCAPE '\\')."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 def _add_partial_filter(
     conditions: list[str],
-    params: list[str],
+    params: list[str | int],
     field: str,
-    values: tuple[str, ...],
+    values: tuple[str, ...] | None,
 ) -> None:
-    """Add partial match filter (case-insensitive LIKE with OR)."""
+    """Add partial match filter (case-insensitive LIKE, any value matches).
+
+    Like `_add_exact_filter`, values are bound as one JSON array. LIKE is
+    already case-insensitive, so neither the column nor the values are
+    lowercased. Wildcards in the values are escaped so they match literally.
+    """
     if values:
-        like_conditions = [f"LOWER({field}) LIKE ?" for _ in values]
-        conditions.append(f"({' OR '.join(like_conditions)})")
-        params.extend(f"%{v.lower()}%" for v in values)
+        conditions.append(
+            f"EXISTS (SELECT 1 FROM json_each(?) WHERE {field} LIKE value ESCAPE '\\')"
+        )
+        params.append(json.dumps([f"%{_escape_like(v)}%" for v in values]))
 
 
 def _parse_csv_field(value: str | None) -> list[str]:
@@ -77,59 +149,172 @@ def _parse_csv_field(value: str | None) -> list[str]:
     return [v.strip() for v in value.split(",") if v.strip()]
 
 
-def _row_to_defect(row: sqlite3.Row) -> Defect:
-    """Convert a database row to a Defect object."""
+# Columns read into a Defect, in the order _row_to_defect unpacks them
+_DEFECT_COLUMNS = (
+    "id",
+    "name",
+    "status",
+    "priority",
+    "severity",
+    "owner",
+    "detected_by",
+    "description",
+    "description_html",
+    "dev_comments",
+    "dev_comments_html",
+    "created",
+    "modified",
+    "closed",
+    "reproducible",
+    "attachment",
+    "detected_in_rel",
+    "detected_in_rcyc",
+    "actual_fix_time",
+    "defect_type",
+    "application",
+    "workstream",
+    "module",
+    "target_date",
+    "scenarios",
+    "blocks",
+    "integrations",
+    "clean_name",
+)
+_DEFECT_SELECT = ", ".join(_DEFECT_COLUMNS)
+_DEFECT_SELECT_QUALIFIED = ", ".join(f"d.{column}" for column in _DEFECT_COLUMNS)
+
+
+def _row_to_defect(row: tuple) -> Defect:
+    """Convert a database row selected with _DEFECT_SELECT to a Defect object.
+
+    This goes through the validating constructor on purpose: pydantic-core's
+    compiled validator builds these 28-field models faster than
+    `Defect.model_construct`, which runs in Python.
+    """
+    (
+        id_,
+        name,
+        status,
+        priority,
+        severity,
+        owner,
+        detected_by,
+        description,
+        description_html,
+        dev_comments,
+        dev_comments_html,
+        created,
+        modified,
+        closed,
+        reproducible,
+        attachment,
+        detected_in_rel,
+        detected_in_rcyc,
+        actual_fix_time,
+        defect_type,
+        application,
+        workstream,
+        module,
+        target_date,
+        scenarios,
+        blocks,
+        integrations,
+        clean_name,
+    ) = row
     return Defect(
-        id=row["id"],
-        name=row["name"],
-        status=row["status"],
-        priority=row["priority"],
-        severity=row["severity"],
-        owner=row["owner"],
-        detected_by=row["detected_by"],
-        description=row["description"],
-        description_html=row["description_html"],
-        dev_comments=row["dev_comments"],
-        dev_comments_html=row["dev_comments_html"],
-        created=row["created"],
-        modified=row["modified"],
-        closed=row["closed"],
-        reproducible=row["reproducible"],
-        attachment=row["attachment"],
-        detected_in_rel=row["detected_in_rel"],
-        detected_in_rcyc=row["detected_in_rcyc"],
-        actual_fix_time=row["actual_fix_time"],
-        defect_type=row["defect_type"],
-        application=row["application"],
-        workstream=row["workstream"],
-        module=row["module"],
-        target_date=row["target_date"],
-        scenarios=_parse_csv_field(row["scenarios"]),
-        blocks=_parse_csv_field(row["blocks"]),
-        integrations=_parse_csv_field(row["integrations"]),
-        clean_name=row["clean_name"],
+        id=id_,
+        name=name,
+        status=status,
+        priority=priority,
+        severity=severity,
+        owner=owner,
+        detected_by=detected_by,
+        description=description,
+        description_html=description_html,
+        dev_comments=dev_comments,
+        dev_comments_html=dev_comments_html,
+        created=created,
+        modified=modified,
+        closed=closed,
+        reproducible=reproducible,
+        attachment=attachment,
+        detected_in_rel=detected_in_rel,
+        detected_in_rcyc=detected_in_rcyc,
+        actual_fix_time=actual_fix_time,
+        defect_type=defect_type,
+        application=application,
+        workstream=workstream,
+        module=module,
+        target_date=target_date,
+        scenarios=_parse_csv_field(scenarios),
+        blocks=_parse_csv_field(blocks),
+        integrations=_parse_csv_field(integrations),
+        clean_name=clean_name,
     )
 
 
 def get_defect_by_id(defect_id: int) -> Defect | None:
     """Fetch a defect by ID from the database.
 
+    Row lookups are memoized per database file, so repeat requests for the
+    same defect skip SQLite until the next sync replaces the database. Each
+    call still builds a fresh Defect, so callers may mutate what they get.
+
     Args:
         defect_id: The defect ID to look up.
 
     Returns:
         Defect if found, None otherwise.
     """
+    try:
+        db_key = _db_file_key(get_db_path())
+    except FileNotFoundError:
+        return None
+    row = _fetch_defect_row(db_key, defect_id)
+    return _row_to_defect(row) if row else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_defect_row(db_key: tuple[str, int, int], defect_id: int) -> tuple | None:
+    """Load one defect's row; db_key only scopes the cache to a database file.
+
+    Rows are immutable tuples, so they're safe to hand out from the cache.
+    """
     try:
         with get_connection() as conn:
             cur = conn.cursor()
-            cur.execute("SELECT * FROM defects WHERE id = ?", (defect_id,))
-            row = cur.fetchone()
-            return _row_to_defect(row) if row else None
+            cur.execute(f"SELECT {_DEFECT_SELECT} FROM defects WHERE id = ?", (defect_id,))
+            return cur.fetchone()
     except FileNotFoundError:
         return None
 
 
+# Constant statements for the common no-filter case, so they skip filter
+# assembly and always hit the same cached prepared statement
+_LIST_ORDER_BY = "priority_rank ASC, priority ASC, created ASC, id ASC"
+_LIST_ALL_SQL = f"SELECT {_DEFECT_SELECT} FROM defects ORDER BY {_LIST_ORDER_BY}"
+_LIST_ALL_PAGE_SQL = _LIST_ALL_SQL + " LIMIT ? OFFSET ?"
+_COUNT_ALL_SQL = "SELECT COUNT(*) FROM defects"
+
+# Rows pulled from the cursor per fetchmany() call when streaming results
+_FETCH_BATCH_SIZE = 256
+
+
+@functools.lru_cache(maxsize=8)
+def _list_order_by(db_key: tuple[str, int, int]) -> str:
+    """Get the list ORDER BY clause for a database file.
+
+    Databases synced before the stored priority_rank column existed compute
+    the same rank per row instead, so they still list until the next sync.
+    db_key only scopes the cache to a database file.
+    """
+    with get_connection() as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(defects)")}
+    if "priority_rank" in columns:
+        return _LIST_ORDER_BY
+    return f"{priority_sort_case_sql()} ASC, priority ASC, created ASC, id ASC"
+
+
 def _build_filter_query(
     status: tuple[str, ...] | None = None,
     owner: tuple[str, ...] | None = None,
@@ -137,7 +322,7 @@ def _build_filter_query(
     defect_type: tuple[str, ...] | None = None,
     priority: tuple[str, ...] | None = None,
     workstream: tuple[str, ...] | None = None,
-) -> tuple[str, list[str]]:
+) -> tuple[str, list[str | int]]:
     """Build WHERE clause and params for defect filters.
 
     Special status values:
@@ -146,37 +331,92 @@ def _build_filter_query(
                        (Closed, Rejected, Duplicate, Deferred)
     """
     conditions: list[str] = []
-    params: list[str] = []
+    params: list[str | int] = []
 
     # Exact match filters
     if status:
         # Special case: "!closed" means everything except Closed status
         if len(status) == 1 and status[0].lower() == "!closed":
-            conditions.append("LOWER(status) != 'closed'")
+            conditions.append("status COLLATE NOCASE != 'closed'")
         # Special case: "!terminal" means everything except terminal statuses
         elif len(status) == 1 and status[0].lower() == "!terminal":
             placeholders = ",".join("?" * len(TERMINAL_STATUSES))
-            conditions.append(f"LOWER(status) NOT IN ({placeholders})")
+            conditions.append(f"status COLLATE NOCASE NOT IN ({placeholders})")
             params.extend(TERMINAL_STATUSES)
         else:
             _add_exact_filter(conditions, params, "status", status)
-    if priority:
-        _add_exact_filter(conditions, params, "priority", priority)
+    _add_exact_filter(conditions, params, "priority", priority)
 
     # Partial match filters
-    if owner:
-        _add_partial_filter(conditions, params, "owner", owner)
-    if module:
-        _add_partial_filter(conditions, params, "module", module)
-    if defect_type:
-        _add_partial_filter(conditions, params, "defect_type", defect_type)
-    if workstream:
-        _add_partial_filter(conditions, params, "workstream", workstream)
+    partial_filters = (
+        ("owner", owner),
+        ("module", module),
+        ("defect_type", defect_type),
+        ("workstream", workstream),
+    )
+    for field, values in partial_filters:
+        _add_partial_filter(conditions, params, field, values)
 
     where = " AND ".join(conditions) if conditions else "1=1"
     return where, params
 
 
+def iter_defects(
+    status: tuple[str, ...] | None = None,
+    owner: tuple[str, ...] | None = None,
+    module: tuple[str, ...] | None = None,
+    defect_type: tuple[str, ...] | None = None,
+    priority: tuple[str, ...] | None = None,
+    workstream: tuple[str, ...] | None = None,
+    limit: int | None = 50,
+    offset: int = 0,
+) -> Iterator[Defect]:
+    """Yield defects matching filters one at a time.
+
+    Takes the same arguments as `list_defects`. Rows are fetched from the
+    cursor in batches as the caller consumes them, so only a small window of
+    rows is held in memory at once.
+
+    Yields:
+        Matching defects, sorted by priority (P1 first) then created date.
+    """
+    try:
+        order_by = _list_order_by(_db_file_key(get_db_path()))
+        with get_connection() as conn:
+            has_filters = any((status, owner, module, defect_type, priority, workstream))
+            if not has_filters and order_by is _LIST_ORDER_BY:
+                query = _LIST_ALL_SQL if limit is None else _LIST_ALL_PAGE_SQL
+                params = [] if limit is None else [limit, offset]
+            else:
+                where, params = _build_filter_query(
+                    status=status,
+                    owner=owner,
+                    module=module,
+                    defect_type=defect_type,
+                    priority=priority,
+                    workstream=workstream,
+                )
+
+                query = f"""
+                    SELECT {_DEFECT_SELECT} FROM defects
+                    WHERE {where}
+                    ORDER BY {order_by}
+                """
+
+                if limit is not None:
+                    query += " LIMIT ? OFFSET ?"
+                    params.extend([limit, offset])
+
+            cur = conn.cursor()
+            cur.arraysize = _FETCH_BATCH_SIZE
+            cur.execute(query, params)
+            while batch := cur.fetchmany():
+                for row in batch:
+                    yield _row_to_defect(row)
+    except FileNotFoundError:
+        return
+
+
 def list_defects(
     status: tuple[str, ...] | None = None,
     owner: tuple[str, ...] | None = None,
@@ -202,34 +442,20 @@ def list_defects(
         offset: Number of results to skip.
 
     Returns:
-        List of matching defects, sorted by priority then created date.
+        List of matching defects, sorted by priority (P1 first) then created date.
     """
-    try:
-        with get_connection() as conn:
-            where, params = _build_filter_query(
-                status=status,
-                owner=owner,
-                module=module,
-                defect_type=defect_type,
-                priority=priority,
-                workstream=workstream,
-            )
-
-            query = f"""
-                SELECT * FROM defects
-                WHERE {where}
-                ORDER BY priority ASC, created ASC
-            """
-
-            if limit is not None:
-                query += " LIMIT ? OFFSET ?"
-                params.extend([str(limit), str(offset)])
-
-            cur = conn.cursor()
-            cur.execute(query, params)
-            return [_row_to_defect(row) for row in cur.fetchall()]
-    except FileNotFoundError:
-        return []
+    return list(
+        iter_defects(
+            status=status,
+            owner=owner,
+            module=module,
+            defect_type=defect_type,
+            priority=priority,
+            workstream=workstream,
+            limit=limit,
+            offset=offset,
+        )
+    )
 
 
 def count_defects(
@@ -242,7 +468,11 @@ def count_defects(
 ) -> int:
     """Return total number of defects matching filters."""
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            if not any((status, owner, module, defect_type, priority, workstream)):
+                cur.execute(_COUNT_ALL_SQL)
+                return cur.fetchone()[0]
             where, params = _build_filter_query(
                 status=status,
                 owner=owner,
@@ -251,8 +481,7 @@ def count_defects(
                 priority=priority,
                 workstream=workstream,
             )
-            cur = conn.cursor()
-            cur.execute(f"SELECT COUNT(*) FROM defects WHERE {where}", params)
+            cur.execute(f"{_COUNT_ALL_SQL} WHERE {where}", params)
             return cur.fetchone()[0]
     except FileNotFoundError:
         return 0
@@ -286,16 +515,21 @@ def search_defects(query: str, limit: int = 50) -> list[Defect]:
             fts_query = " ".join(f'"{word}"*' for word in words)
 
             cur.execute(
-                """
-                SELECT d.* FROM defects d
-                JOIN defects_fts fts ON d.id = fts.rowid
-                WHERE defects_fts MATCH ?
-                ORDER BY rank
-                LIMIT ?
+                # Rank and limit inside the FTS index, so only the top matches
+                # are joined back to defects
+                f"""
+                SELECT {_DEFECT_SELECT_QUALIFIED} FROM (
+                    SELECT rowid, rank FROM defects_fts
+                    WHERE defects_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ) m
+                JOIN defects d ON d.id = m.rowid
+                ORDER BY m.rank
                 """,
                 (fts_query, limit),
             )
-            return [_row_to_defect(row) for row in cur.fetchall()]
+            return [_row_to_defect(row) for row in cur]
     except FileNotFoundError:
         return []
 
@@ -346,24 +580,106 @@ class Stats:
         self.close_time = close_time
 
 
-def _get_breakdown(
+# Fields broken down in stats; priority is always shown in full
+_BREAKDOWN_FIELDS = ("priority", "module", "owner", "defect_type", "workstream")
+
+
+def _build_breakdowns_sql(status_filter: str) -> str:
+    """Build the query behind `_get_breakdowns` for one status filter.
+
+    The filtered rows are materialized once and grouped per field, instead of
+    scanning the table once per field. Within a field, rows are ordered by
+    count (descending) then value. The `:limit` parameter caps entries per
+    field other than priority (0 for no limit).
+    """
+    counts = "\n        UNION ALL\n        ".join(
+        f"SELECT '{field}', {field}, COUNT(*) FROM scoped GROUP BY {field}"
+        for field in _BREAKDOWN_FIELDS
+    )
+    return f"""
+        WITH scoped AS MATERIALIZED (
+            SELECT {", ".join(_BREAKDOWN_FIELDS)} FROM defects {status_filter}
+        ),
+        counts(field, value, count) AS (
+        {counts}
+        ),
+        ranked AS (
+            SELECT field, value, count,
+                ROW_NUMBER() OVER (PARTITION BY field ORDER BY count DESC, value) AS rn
+            FROM counts
+        )
+        SELECT field, value, count FROM ranked
+        WHERE field = 'priority' OR :limit <= 0 OR rn <= :limit
+        ORDER BY field, rn
+    """
+
+
+# Stats statements are built once, so each call passes SQLite the same
+# strings and hits the connection's prepared statement cache.
+# Active = not in terminal status (Closed, Rejected, Duplicate, Deferred)
+_ACTIVE_FILTER = terminal_status_filter(exclude=True)
+_COUNT_ACTIVE_SQL = f"{_COUNT_ALL_SQL} WHERE {_ACTIVE_FILTER}"
+# Keyed by include_closed
+_BREAKDOWNS_SQL = {
+    False: _build_breakdowns_sql(f"WHERE {_ACTIVE_FILTER}"),
+    True: _build_breakdowns_sql(""),
+}
+_OLDEST_ACTIVE_SQL = f"""
+    SELECT id, name, created
+    FROM defects
+    WHERE {_ACTIVE_FILTER} AND created IS NOT NULL
+    ORDER BY created ASC
+    LIMIT 1
+"""
+
+# Scalar stats in one round trip: total, active count, and close-time count,
+# average, p50 and p75. Close times are sorted once by a window function and
+# the percentiles picked out by position (n // 2 and int(n * 0.75)), so only
+# one row comes back rather than every close time.
+_SUMMARY_SQL = f"""
+    WITH close_days AS (
+        -- Days from created to closed, for defects closed on or after creation
+        SELECT julianday(closed) - julianday(created) AS days
+        FROM defects
+        WHERE closed IS NOT NULL AND created IS NOT NULL AND days >= 0
+    ),
+    ranked AS (
+        SELECT days, ROW_NUMBER() OVER (ORDER BY days) - 1 AS i, COUNT(*) OVER () AS n
+        FROM close_days
+    ),
+    close AS (
+        SELECT
+            COUNT(*) AS n,
+            AVG(days) AS avg,
+            MAX(CASE WHEN i = n / 2 THEN days END) AS p50,
+            MAX(CASE WHEN i = CAST(n * 0.75 AS INTEGER) THEN days END) AS p75
+        FROM ranked
+    )
+    SELECT ({_COUNT_ALL_SQL}), ({_COUNT_ACTIVE_SQL}), close.n, close.avg, close.p50, close.p75
+    FROM close
+"""
+
+
+def _get_breakdowns(
     cur: sqlite3.Cursor,
-    field: str,
-    status_filter: str,
+    include_closed: bool,
     limit: int | None = None,
-) -> list[tuple[str, int]]:
-    """Get count breakdown by field."""
-    query = f"""
-        SELECT {field}, COUNT(*) as count
-        FROM defects {status_filter}
-        GROUP BY {field}
-        ORDER BY count DESC
+) -> dict[str, list[tuple[str, int]]]:
+    """Get count breakdowns for every field in _BREAKDOWN_FIELDS in one query.
+
+    Args:
+        cur: Database cursor.
+        include_closed: Include closed defects (default: active only).
+        limit: Maximum entries per field other than priority (falsy for no limit).
+
+    Returns:
+        Mapping of field name to (value, count) pairs.
     """
-    if limit:
-        cur.execute(query + " LIMIT ?", (limit,))
-    else:
-        cur.execute(query)
-    return [(row[0] or "(none)", row[1]) for row in cur.fetchall()]
+    cur.execute(_BREAKDOWNS_SQL[include_closed], {"limit": limit or 0})
+    breakdowns: dict[str, list[tuple[str, int]]] = {field: [] for field in _BREAKDOWN_FIELDS}
+    for field, value, count in cur:
+        breakdowns[field].append((value or "(none)", count))
+    return breakdowns
 
 
 def get_stats(include_closed: bool = False, top_n: int = 5) -> Stats | None:
@@ -377,59 +693,30 @@ def get_stats(include_closed: bool = False, top_n: int = 5) -> Stats | None:
         Stats object, or None if no database exists.
     """
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
 
-            # Total counts
-            cur.execute("SELECT COUNT(*) FROM defects")
-            total = cur.fetchone()[0]
-
-            # Active = not in terminal status (Closed, Rejected, Duplicate, Deferred)
-            terminal_filter = terminal_status_filter(exclude=True)
-            cur.execute(f"SELECT COUNT(*) FROM defects WHERE {terminal_filter}")
-            open_count = cur.fetchone()[0]
+            # Totals and close-time stats
+            cur.execute(_SUMMARY_SQL)
+            total, open_count, close_time_count, avg, p50, p75 = cur.fetchone()
 
             closed_count = total - open_count
 
-            # Status filter for breakdowns (active defects only by default)
-            status_filter = "" if include_closed else f"WHERE {terminal_filter}"
-
-            # Get breakdowns
-            by_priority = _get_breakdown(cur, "priority", status_filter)
+            # Get breakdowns (active defects only by default)
+            breakdowns = _get_breakdowns(cur, include_closed, top_n)
+            by_priority = breakdowns["priority"]
             by_priority.sort(key=lambda x: x[0])  # Sort by priority name
-            by_module = _get_breakdown(cur, "module", status_filter, top_n)
-            by_owner = _get_breakdown(cur, "owner", status_filter, top_n)
-            by_type = _get_breakdown(cur, "defect_type", status_filter, top_n)
-            by_workstream = _get_breakdown(cur, "workstream", status_filter, top_n)
 
             # Oldest active defect
             oldest_open = None
-            cur.execute(f"""
-                SELECT id, name, created
-                FROM defects
-                WHERE {terminal_filter} AND created IS NOT NULL
-                ORDER BY created ASC
-                LIMIT 1
-            """)
+            cur.execute(_OLDEST_ACTIVE_SQL)
             row = cur.fetchone()
             if row:
                 oldest_open = OldestDefect(id=row[0], name=row[1], created=row[2])
 
             # Close time stats (for defects with both created and closed dates)
             close_time = None
-            cur.execute("""
-                SELECT julianday(closed) - julianday(created) as days
-                FROM defects
-                WHERE closed IS NOT NULL AND created IS NOT NULL
-                ORDER BY days ASC
-            """)
-            close_days = [row[0] for row in cur.fetchall() if row[0] is not None and row[0] >= 0]
-
-            if close_days:
-                n = len(close_days)
-                p50 = close_days[n // 2]
-                p75 = close_days[min(int(n * 0.75), n - 1)]
-                avg = sum(close_days) / n
+            if close_time_count:
                 close_time = CloseTimeStats(p50=p50, p75=p75, avg=avg)
 
             return Stats(
@@ -437,10 +724,10 @@ def get_stats(include_closed: bool = False, top_n: int = 5) -> Stats | None:
                 open_count=open_count,
                 closed_count=closed_count,
                 by_priority=by_priority,
-                by_module=by_module,
-                by_owner=by_owner,
-                by_type=by_type,
-                by_workstream=by_workstream,
+                by_module=breakdowns["module"],
+                by_owner=breakdowns["owner"],
+                by_type=breakdowns["defect_type"],
+                by_workstream=breakdowns["workstream"],
                 oldest_open=oldest_open,
                 close_time=close_time,
             )
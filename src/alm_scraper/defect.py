@@ -1,10 +1,17 @@
 """Defect model and ALM data parsing."""
 
+import functools
 import html.parser
 import re
-from typing import Any
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    import lxml.etree
 
 
 class Defect(BaseModel):
@@ -46,14 +53,34 @@ class Defect(BaseModel):
     clean_name: str | None = None  # Title with prefixes removed
 
 
+@functools.cache
+def _defect_list_adapter() -> TypeAdapter[list[Defect]]:
+    """Build the list[Defect] serializer once, on first use."""
+    return TypeAdapter(list[Defect])
+
+
+def dump_defects_json(defects: list[Defect]) -> bytes:
+    """Serialize defects as an indented JSON array of objects.
+
+    pydantic-core serializes the models directly, without building a dict
+    per defect first. Non-ASCII text is written as raw UTF-8, not \\uXXXX
+    escapes.
+    """
+    return _defect_list_adapter().dump_json(defects, indent=2)
+
+
+_INLINE_WHITESPACE_PATTERN = re.compile(r"[ \t]+")
+
+
 class HTMLTextExtractor(html.parser.HTMLParser):
     """Extract plain text from HTML, preserving block structure."""
 
     # Tags that create line breaks
     BLOCK_TAGS = {"div", "p", "br", "tr", "li", "h1", "h2", "h3", "h4", "h5", "h6"}
 
-    def __init__(self) -> None:
-        super().__init__()
+    def reset(self) -> None:
+        """Reset parser state and collected text so the instance can be reused."""
+        super().reset()
         self.text_parts: list[str] = []
         self._in_style = False
 
@@ -164,21 +191,69 @@ def extract_scenario_codes(name: str) -> tuple[list[str], list[str], list[str],
     return sorted(scenarios), sorted(blocks), sorted(integrations), clean_name
 
 
+def _collect_text(element: "lxml.etree._Element", parts: list[str]) -> None:
+    """Append an lxml element's text (and tail) to parts, in document order.
+
+    Mirrors HTMLTextExtractor's flat output: style contents and comments are
+    dropped, and block elements are preceded by a separator.
+    """
+    tag = element.tag
+    # Comments and processing instructions have a non-string tag
+    if isinstance(tag, str):
+        if tag in HTMLTextExtractor.BLOCK_TAGS:
+            parts.append(" ")
+        if tag != "style":
+            if element.text:
+                parts.append(element.text)
+            for child in element:
+                _collect_text(child, parts)
+    if element.tail:
+        parts.append(element.tail)
+
+
 def strip_html(html_content: str | None) -> str | None:
-    """Strip HTML tags and return plain text."""
+    """Strip HTML tags and return plain text.
+
+    Uses lxml's C parser, which is several times faster than html.parser for
+    the descriptions parsed on every sync.
+    """
     if not html_content:
         return None
 
-    parser = HTMLTextExtractor()
+    from lxml import etree
+
     try:
-        parser.feed(html_content)
-        text = parser.get_text()
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-        return text if text else None
+        root = etree.HTML(html_content)
     except Exception:
-        # If parsing fails, return original
-        return html_content
+        # lxml rejects some input html.parser copes with (e.g. a str carrying
+        # an XML encoding declaration), so fall back to it, never raw markup
+        parser = _get_extractor()
+        parser.feed(html_content)
+        raw_text = parser.get_text()
+    else:
+        if root is None:
+            return None
+        parts: list[str] = []
+        _collect_text(root, parts)
+        raw_text = "".join(parts)
+    # Collapse whitespace runs and trim the ends in one pass; split() with
+    # no separator treats exactly the characters re's \s matches as spaces
+    text = " ".join(raw_text.split())
+    return text if text else None
+
+
+# One extractor per thread, reset between uses rather than rebuilt per call
+_extractors = threading.local()
+
+
+def _get_extractor() -> HTMLTextExtractor:
+    """Get this thread's HTMLTextExtractor, reset and ready to feed."""
+    parser = getattr(_extractors, "parser", None)
+    if parser is None:
+        parser = _extractors.parser = HTMLTextExtractor()
+    else:
+        parser.reset()
+    return parser
 
 
 def strip_html_preserve_structure(html_content: str | None) -> str | None:
@@ -186,7 +261,7 @@ def strip_html_preserve_structure(html_content: str | None) -> str | None:
     if not html_content:
         return None
 
-    parser = HTMLTextExtractor()
+    parser = _get_extractor()
     try:
         parser.feed(html_content)
         text = parser.get_text()
@@ -195,7 +270,7 @@ def strip_html_preserve_structure(html_content: str | None) -> str | None:
         lines = text.split("\n")
         cleaned_lines: list[str] = []
         for line in lines:
-            cleaned = re.sub(r"[ \t]+", " ", line).strip()
+            cleaned = _INLINE_WHITESPACE_PATTERN.sub(" ", line).strip()
             cleaned_lines.append(cleaned)
 
         # Collapse multiple blank lines into one
@@ -216,6 +291,56 @@ def strip_html_preserve_structure(html_content: str | None) -> str | None:
         return html_content
 
 
+# ALM field names read into a Defect, in the order parse_alm_entity unpacks them.
+# Custom fields are user-template-XX (mapped to readable names on Defect).
+_ALM_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "priority",
+    "severity",
+    "owner",
+    "detected-by",
+    "description",
+    "dev-comments",
+    "creation-time",
+    "last-modified",
+    "closing-date",
+    "reproducible",
+    "attachment",
+    "detected-in-rel",
+    "detected-in-rcyc",
+    "actual-fix-time",
+    "user-template-08",
+    "user-01",
+    "user-template-02",
+    "user-template-03",
+    "user-template-12",
+)
+_ALM_FIELD_INDEX = {name: index for index, name in enumerate(_ALM_FIELDS)}
+
+# Low-cardinality fields whose values repeat across most defects. Interning
+# them makes every defect share one string object per distinct value instead
+# of holding its own copy.
+_INTERNED_FIELDS = frozenset(
+    _ALM_FIELD_INDEX[name]
+    for name in (
+        "status",
+        "priority",
+        "severity",
+        "owner",
+        "detected-by",
+        "reproducible",
+        "detected-in-rel",
+        "detected-in-rcyc",
+        "user-template-08",
+        "user-01",
+        "user-template-02",
+        "user-template-03",
+    )
+)
+
+
 def parse_alm_entity(entity: dict[str, Any]) -> Defect:
     """Parse an ALM entity into a normalized Defect.
 
@@ -225,35 +350,62 @@ def parse_alm_entity(entity: dict[str, Any]) -> Defect:
     Returns:
         Normalized Defect object.
     """
-    # Build a lookup from field name to value
-    fields: dict[str, str | None] = {}
+    # Pick out the fields we keep by position, skipping the rest without
+    # building a lookup of every field ALM sent
+    values: list[str | None] = [None] * len(_ALM_FIELDS)
 
     for field in entity.get("Fields", []):
-        name = field.get("Name", "")
-        values = field.get("values", [])
+        index = _ALM_FIELD_INDEX.get(field.get("Name", ""))
+        if index is None:
+            continue
+        field_values = field.get("values", [])
 
         # Extract the value - handle empty arrays, empty objects, and actual values
-        if not values:
-            fields[name] = None
-        elif isinstance(values[0], dict):
-            fields[name] = values[0].get("value")
+        if field_values and isinstance(field_values[0], dict):
+            value = field_values[0].get("value")
+            if index in _INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            values[index] = value
         else:
-            fields[name] = None
+            values[index] = None
+
+    (
+        raw_id,
+        raw_name,
+        status,
+        priority,
+        severity,
+        owner,
+        detected_by,
+        description_html,
+        dev_comments_html,
+        created,
+        modified,
+        closed,
+        reproducible,
+        attachment,
+        detected_in_rel,
+        detected_in_rcyc,
+        fix_time_str,
+        defect_type,
+        application,
+        workstream,
+        module,
+        target_date,
+    ) = values
 
     # Parse required fields
-    defect_id = int(fields.get("id") or 0)
-    name = fields.get("name") or ""
+    defect_id = int(raw_id) if raw_id else 0
+    name = raw_name or ""
 
     # Extract scenario codes and clean name from title
     scenarios, blocks, integrations, clean_name = extract_scenario_codes(name)
 
-    # Parse optional fields
-    description_html = fields.get("description")
-    dev_comments_html = fields.get("dev-comments")
-
-    # Parse actual-fix-time as int
-    fix_time_str = fields.get("actual-fix-time")
-    actual_fix_time = int(fix_time_str) if fix_time_str else None
+    # Parse actual-fix-time as int; anything non-numeric is treated as unset
+    try:
+        actual_fix_time = int(fix_time_str) if fix_time_str else None
+    except ValueError:
+        actual_fix_time = None
 
     return Defect(
         id=defect_id,
@@ -262,31 +414,44 @@ def parse_alm_entity(entity: dict[str, Any]) -> Defect:
         blocks=blocks,
         integrations=integrations,
         clean_name=clean_name,
-        status=fields.get("status"),
-        priority=fields.get("priority"),
-        severity=fields.get("severity"),
-        owner=fields.get("owner"),
-        detected_by=fields.get("detected-by"),
+        status=status,
+        priority=priority,
+        severity=severity,
+        owner=owner,
+        detected_by=detected_by,
         description=strip_html(description_html),
         description_html=description_html,
         dev_comments=strip_html_preserve_structure(dev_comments_html),
         dev_comments_html=dev_comments_html,
-        created=fields.get("creation-time"),
-        modified=fields.get("last-modified"),
-        closed=fields.get("closing-date"),
-        reproducible=fields.get("reproducible"),
-        attachment=fields.get("attachment"),
-        detected_in_rel=fields.get("detected-in-rel"),
-        detected_in_rcyc=fields.get("detected-in-rcyc"),
+        created=created,
+        modified=modified,
+        closed=closed,
+        reproducible=reproducible,
+        attachment=attachment,
+        detected_in_rel=detected_in_rel,
+        detected_in_rcyc=detected_in_rcyc,
         actual_fix_time=actual_fix_time,
-        defect_type=fields.get("user-template-08"),
-        application=fields.get("user-01"),
-        workstream=fields.get("user-template-02"),
-        module=fields.get("user-template-03"),
-        target_date=fields.get("user-template-12"),
+        defect_type=defect_type,
+        application=application,
+        workstream=workstream,
+        module=module,
+        target_date=target_date,
     )
 
 
+def parse_alm_response_stream(entities: Iterable[dict[str, Any]]) -> Iterator[Defect]:
+    """Parse ALM entities into Defects one at a time.
+
+    Args:
+        entities: Raw entity dicts, e.g. from `ALMClient.fetch_defects_iter`.
+
+    Yields:
+        Normalized Defect objects, in input order.
+    """
+    for entity in entities:
+        yield parse_alm_entity(entity)
+
+
 def parse_alm_response(data: dict[str, Any]) -> list[Defect]:
     """Parse an ALM API response into a list of Defects.
 
@@ -296,5 +461,4 @@ def parse_alm_response(data: dict[str, Any]) -> list[Defect]:
     Returns:
         List of normalized Defect objects.
     """
-    entities = data.get("entities", [])
-    return [parse_alm_entity(entity) for entity in entities]
+    return list(parse_alm_response_stream(data.get("entities", [])))
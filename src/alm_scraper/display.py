@@ -1,15 +1,28 @@
 """Display formatting for defects."""
 
-from rich.console import Console
+import functools
+
+import orjson
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from alm_scraper.db import Stats
-from alm_scraper.defect import Defect, strip_html_preserve_structure
+from alm_scraper.defect import Defect, dump_defects_json, strip_html_preserve_structure
 from alm_scraper.utils import strip_domain, truncate
 
 
+@functools.lru_cache(maxsize=512)
+def _format_dev_comments(html: str | None) -> str | None:
+    """Render dev comments HTML as structured text.
+
+    Cached on the HTML itself, so showing a defect in several formats (or
+    defects sharing a comment thread) parses it once.
+    """
+    return strip_html_preserve_structure(html)
+
+
 def format_defect(defect: Defect, console: Console) -> None:
     """Display a defect nicely formatted to the console.
 
@@ -57,29 +70,25 @@ def format_defect(defect: Defect, console: Console) -> None:
     if defect.defect_type:
         meta.add_row("Type:", defect.defect_type)
 
-    # Print everything
-    console.print()
-    console.print(Panel(title, style="bold"))
-    console.print(status_line)
-    console.print()
-    console.print(meta)
+    # Render everything as one group, in a single print
+    parts: list[RenderableType] = ["", Panel(title, style="bold"), status_line, "", meta]
 
     # Description
     if defect.description:
-        console.print()
-        console.print("[bold]Description:[/bold]")
-        console.print(defect.description)
+        parts += ["", "[bold]Description:[/bold]", defect.description]
 
     # Dev comments - parse from HTML for proper formatting
-    dev_comments = strip_html_preserve_structure(defect.dev_comments_html)
+    dev_comments = _format_dev_comments(defect.dev_comments_html)
     if dev_comments:
-        console.print()
-        console.print("[bold]Dev Comments:[/bold]")
-        console.print(dev_comments)
+        parts += ["", "[bold]Dev Comments:[/bold]", dev_comments]
 
-    console.print()
+    parts.append("")
+    console.print(Group(*parts))
 
 
+# Statuses and priorities take only a handful of distinct values, so the
+# color helpers are cached per value
+@functools.lru_cache(maxsize=64)
 def _get_status_color(status: str | None) -> str:
     """Get color for status display."""
     if not status:
@@ -95,6 +104,7 @@ def _get_status_color(status: str | None) -> str:
     return "white"
 
 
+@functools.lru_cache(maxsize=64)
 def _get_priority_color(priority: str | None) -> str:
     """Get color for priority display."""
     if not priority:
@@ -112,6 +122,13 @@ def _get_priority_color(priority: str | None) -> str:
     return "white"
 
 
+@functools.lru_cache(maxsize=64)
+def _short_priority(priority: str | None) -> str:
+    """Shorten a priority for table display (P1-Critical -> P1)."""
+    pri = priority or "-"
+    return pri.partition("-")[0] if pri.startswith("P") else pri
+
+
 def format_defect_markdown(defect: Defect) -> str:
     """Format a defect as markdown.
 
@@ -121,57 +138,45 @@ def format_defect_markdown(defect: Defect) -> str:
     Returns:
         Markdown string.
     """
-    lines: list[str] = []
-
-    # Header
-    lines.append(f"# Defect #{defect.id}: {defect.name}")
-    lines.append("")
-
     # Status line
-    status_parts = [f"**Status:** {defect.status or 'Unknown'}"]
-    status_parts.append(f"**Priority:** {defect.priority or 'Unknown'}")
+    status_parts = [
+        f"**Status:** {defect.status or 'Unknown'}",
+        f"**Priority:** {defect.priority or 'Unknown'}",
+    ]
     if defect.owner:
         status_parts.append(f"**Owner:** {defect.owner}")
-    lines.append(" | ".join(status_parts))
-    lines.append("")
 
-    # Metadata table
-    lines.append("| Field | Value |")
-    lines.append("|-------|-------|")
-
-    if defect.detected_by:
-        lines.append(f"| Detected by | {defect.detected_by} |")
-    if defect.created:
-        lines.append(f"| Created | {defect.created} |")
-    if defect.modified:
-        lines.append(f"| Modified | {defect.modified} |")
-    if defect.closed:
-        lines.append(f"| Closed | {defect.closed} |")
-    if defect.application:
-        lines.append(f"| Application | {defect.application} |")
-    if defect.workstream:
-        lines.append(f"| Workstream | {defect.workstream} |")
-    if defect.module:
-        lines.append(f"| Module | {defect.module} |")
-    if defect.defect_type:
-        lines.append(f"| Type | {defect.defect_type} |")
+    # Metadata table rows; empty fields are left out
+    metadata = (
+        ("Detected by", defect.detected_by),
+        ("Created", defect.created),
+        ("Modified", defect.modified),
+        ("Closed", defect.closed),
+        ("Application", defect.application),
+        ("Workstream", defect.workstream),
+        ("Module", defect.module),
+        ("Type", defect.defect_type),
+    )
 
+    lines = [
+        f"# Defect #{defect.id}: {defect.name}",
+        "",
+        " | ".join(status_parts),
+        "",
+        "| Field | Value |",
+        "|-------|-------|",
+    ]
+    lines.extend(f"| {label} | {value} |" for label, value in metadata if value)
     lines.append("")
 
     # Description
     if defect.description:
-        lines.append("## Description")
-        lines.append("")
-        lines.append(defect.description)
-        lines.append("")
+        lines.extend(("## Description", "", defect.description, ""))
 
     # Dev comments - parse from HTML for proper formatting
-    dev_comments = strip_html_preserve_structure(defect.dev_comments_html)
+    dev_comments = _format_dev_comments(defect.dev_comments_html)
     if dev_comments:
-        lines.append("## Dev Comments")
-        lines.append("")
-        lines.append(dev_comments)
-        lines.append("")
+        lines.extend(("## Dev Comments", "", dev_comments, ""))
 
     return "\n".join(lines)
 
@@ -185,9 +190,7 @@ def format_defect_json(defect: Defect) -> str:
     Returns:
         JSON string.
     """
-    import json
-
-    return json.dumps(defect.model_dump(), indent=2)
+    return defect.model_dump_json(indent=2)
 
 
 def format_defect_table(
@@ -213,26 +216,17 @@ def format_defect_table(
     table.add_column("Name", no_wrap=True)
     table.add_column("Owner", style="dim", no_wrap=True)
 
-    for d in defects:
-        status_style = _get_status_color(d.status)
-        priority_style = _get_priority_color(d.priority)
-
-        name = truncate(d.name or "", 45)
-
-        # Short priority (P1, P2, P3, P4)
-        pri = d.priority or "-"
-        if pri.startswith("P") and "-" in pri:
-            pri = pri.split("-")[0]
+    # Build each column in one pass over the defects, then add rows from them
+    ids = [f"#{d.id}" for d in defects]
+    statuses = [Text(d.status or "-", style=_get_status_color(d.status)) for d in defects]
+    pris = [
+        Text(_short_priority(d.priority), style=_get_priority_color(d.priority)) for d in defects
+    ]
+    names = [truncate(d.name or "", 45) for d in defects]
+    owners = [truncate(strip_domain(d.owner or "-"), 15) for d in defects]
 
-        owner = truncate(strip_domain(d.owner or "-"), 15)
-
-        table.add_row(
-            f"#{d.id}",
-            Text(d.status or "-", style=status_style),
-            Text(pri, style=priority_style),
-            name,
-            owner,
-        )
+    for row in zip(ids, statuses, pris, names, owners, strict=True):
+        table.add_row(*row)
 
     console.print(table)
 
@@ -245,6 +239,21 @@ def format_defect_table(
         console.print(f"[dim]{len(defects)} defects[/dim]")
 
 
+def format_defects_json_bytes(defects: list[Defect]) -> bytes:
+    """Format a list of defects as UTF-8 encoded JSON.
+
+    Use this when writing straight to a binary stream, to skip the
+    decode/re-encode round trip of `format_defects_json`.
+
+    Args:
+        defects: List of defects to format.
+
+    Returns:
+        JSON bytes.
+    """
+    return dump_defects_json(defects)
+
+
 def format_defects_json(defects: list[Defect]) -> str:
     """Format a list of defects as JSON.
 
@@ -254,9 +263,7 @@ def format_defects_json(defects: list[Defect]) -> str:
     Returns:
         JSON string.
     """
-    import json
-
-    return json.dumps([d.model_dump() for d in defects], indent=2)
+    return format_defects_json_bytes(defects).decode()
 
 
 def _format_days(days: float) -> str:
@@ -359,11 +366,12 @@ def format_stats(
         max_count = max(count for _, count in processed_items)
         count_width = len(str(max_count))
 
+        rows = []
         for label, count in processed_items:
             pct = (count / base_count * 100) if base_count > 0 else 0
-            console.print(
-                f"  {label:<{max_label}}  {count:>{count_width}}  [dim]({pct:.0f}%)[/dim]"
-            )
+            rows.append(f"  {label:<{max_label}}  {count:>{count_width}}  [dim]({pct:.0f}%)[/dim]")
+        # One print for all rows; each row is still parsed for markup on its own
+        console.print(Group(*rows))
 
     print_breakdown("Priority", stats.by_priority)
     print_breakdown("Module", stats.by_module, top_n_limit=top_n)
@@ -383,8 +391,6 @@ def format_stats_json(stats: Stats) -> str:
     Returns:
         JSON string.
     """
-    import json
-
     data: dict[str, object] = {
         "total": stats.total,
         "open": stats.open_count,
@@ -412,4 +418,4 @@ def format_stats_json(stats: Stats) -> str:
             "avg_days": stats.close_time.avg,
         }
 
-    return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
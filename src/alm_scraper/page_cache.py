@@ -0,0 +1,102 @@
+"""On-disk cache of ALM pages for conditional (ETag / Last-Modified) requests."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+
+from alm_scraper.utils import write_json
+
+
+def get_cache_dir() -> Path:
+    """Get the page cache directory path."""
+    return Path.home() / ".cache" / "alm-scraper" / "pages"
+
+
+class PageCache:
+    """Stores page bodies with their validators so unchanged pages can be reused.
+
+    Each entry is two files named by a hash of the request: `<key>.json` holds
+    the raw response body and `<key>.meta.json` holds the ETag/Last-Modified
+    values the server sent with it.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir or get_cache_dir()
+
+    def key(self, path: str, params: dict[str, str]) -> str:
+        """Build a stable cache key for a request path and its query params."""
+        raw = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.meta.json"
+
+    def _read_meta(self, key: str) -> dict[str, Any] | None:
+        """Read an entry's validators, or None if missing or unreadable."""
+        try:
+            meta = json.loads(self._meta_path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    def conditional_headers(self, key: str) -> dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for a cached entry.
+
+        Returns an empty dict when there is no usable entry.
+        """
+        if not self._body_path(key).exists():
+            return {}
+        meta = self._read_meta(key)
+        if meta is None:
+            return {}
+
+        headers: dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Load a cached page body, or None if it's missing or unreadable.
+
+        A None result makes the client re-request the page unconditionally,
+        which also overwrites a damaged entry.
+        """
+        try:
+            data = orjson.loads(self._body_path(key).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """Save a successful response if the server sent any validators.
+
+        Each file is written under a .tmp name and renamed into place, so an
+        interrupted write never leaves a partial entry. The old validators
+        are removed first, so they can't be sent with a body they don't match.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta_path = self._meta_path(key)
+        meta_path.unlink(missing_ok=True)
+
+        body_path = self._body_path(key)
+        body_tmp = body_path.with_name(body_path.name + ".tmp")
+        body_tmp.write_bytes(response.content)
+        body_tmp.replace(body_path)
+
+        meta_tmp = meta_path.with_name(meta_path.name + ".tmp")
+        write_json(meta_tmp, {"etag": etag, "last_modified": last_modified})
+        meta_tmp.replace(meta_path)
@@ -2,9 +2,15 @@
 
 import csv
 import io
-import json
+import itertools
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from typing import IO
 
-from alm_scraper.db import get_connection
+import orjson
+
+from alm_scraper.db import get_connection, get_db_path
 
 # Column descriptions for schema documentation
 COLUMN_DOCS = {
@@ -32,6 +38,7 @@ COLUMN_DOCS = {
     "detected_in_rcyc": "Detected in release cycle",
     "actual_fix_time": "Actual fix time",
     "target_date": "Target fix date",
+    "priority_rank": "Priority sort order (1 = P1-Critical ... 4 = P4-Low, 999 = other)",
 }
 
 SCHEMA_HELP = """
@@ -71,62 +78,98 @@ EXAMPLES:
 """
 
 
+# Schema help for when no database exists yet, built from COLUMN_DOCS alone
+_STATIC_SCHEMA_HELP = SCHEMA_HELP.format(
+    columns="\n".join(f"  {col:20} -- {desc}" for col, desc in COLUMN_DOCS.items())
+)
+
+# Last generated schema help, keyed by the database's mtime
+_schema_help_cache: tuple[int, str] | None = None
+
+
 def get_schema_help() -> str:
-    """Generate schema documentation."""
+    """Generate schema documentation.
+
+    The result is cached until the database file changes, so repeated
+    `alm query --help` renders skip the PRAGMA round trip.
+    """
+    global _schema_help_cache
+
     try:
-        with get_connection(row_factory=False) as conn:
-            cur = conn.execute("PRAGMA table_info(defects)")
-            rows = cur.fetchall()
-
-            lines = []
-            for row in rows:
-                col_name = row[1]
-                col_type = row[2] or "TEXT"
-                desc = COLUMN_DOCS.get(col_name, "")
-                if desc:
-                    lines.append(f"  {col_name:20} {col_type:10} -- {desc}")
-                else:
-                    lines.append(f"  {col_name:20} {col_type}")
-
-            columns = "\n".join(lines)
+        mtime_ns = get_db_path().stat().st_mtime_ns
+    except FileNotFoundError:
+        return _STATIC_SCHEMA_HELP
+
+    if _schema_help_cache is not None and _schema_help_cache[0] == mtime_ns:
+        return _schema_help_cache[1]
+
+    text = _build_schema_help()
+    _schema_help_cache = (mtime_ns, text)
+    return text
+
+
+def _build_schema_help() -> str:
+    """Build schema documentation from the database, or statically without one."""
+    try:
+        with get_connection() as conn:
+            # table_xinfo (unlike table_info) includes generated columns
+            cur = conn.execute("PRAGMA table_xinfo(defects)")
+            columns = "\n".join(_schema_line(name, col_type) for _, name, col_type, *_ in cur)
             return SCHEMA_HELP.format(columns=columns)
     except FileNotFoundError:
-        # Return static schema if no DB exists yet
-        columns = "\n".join(f"  {col:20} -- {desc}" for col, desc in COLUMN_DOCS.items())
-        return SCHEMA_HELP.format(columns=columns)
+        return _STATIC_SCHEMA_HELP
+
+
+def _schema_line(col_name: str, col_type: str) -> str:
+    """Format one column of the schema help, with its description if known."""
+    col_type = col_type or "TEXT"
+    desc = COLUMN_DOCS.get(col_name, "")
+    if desc:
+        return f"  {col_name:20} {col_type:10} -- {desc}"
+    return f"  {col_name:20} {col_type}"
+
+
+# Matched at the start of the query, so only the leading keyword is examined
+# however long the SQL is
+_SAFE_QUERY_PATTERN = re.compile(r"\s*(?:SELECT|WITH|EXPLAIN)", re.IGNORECASE)
 
 
 def is_safe_query(sql: str) -> bool:
     """Check if query is read-only (SELECT, WITH, EXPLAIN)."""
-    normalized = sql.strip().upper()
-    return (
-        normalized.startswith("SELECT")
-        or normalized.startswith("WITH")
-        or normalized.startswith("EXPLAIN")
-    )
+    return _SAFE_QUERY_PATTERN.match(sql) is not None
+
+
+def _display_cell(val: object) -> str:
+    """Render a value for the text table, truncating long values."""
+    val_str = str(val) if val is not None else "NULL"
+    if len(val_str) > 60:
+        val_str = val_str[:57] + "..."
+    return val_str
 
 
 class QueryResult:
-    """Result of a SQL query."""
+    """Result of a SQL query.
 
-    def __init__(self, columns: list[str], rows: list[tuple]) -> None:
+    `rows` is either a list or, for a streamed query, an iterator over the
+    cursor. An iterator can only be formatted once.
+    """
+
+    def __init__(self, columns: list[str], rows: Iterable[tuple]) -> None:
         self.columns = columns
         self.rows = rows
 
     def to_table(self) -> str:
         """Format as aligned text table."""
-        if not self.rows:
+        # Stringify each cell once, then size columns from the results
+        cells = [[_display_cell(val) for val in row] for row in self.rows]
+        if not cells:
             return "(no results)"
 
-        # Calculate column widths
         widths = [len(col) for col in self.columns]
-        for row in self.rows:
-            for i, val in enumerate(row):
-                val_str = str(val) if val is not None else "NULL"
-                # Truncate long values for display
-                if len(val_str) > 60:
-                    val_str = val_str[:57] + "..."
-                widths[i] = max(widths[i], len(val_str))
+        for row_strs in cells:
+            for i, val_str in enumerate(row_strs):
+                if len(val_str) > widths[i]:
+                    widths[i] = len(val_str)
 
         # Build table
         lines = []
@@ -137,36 +180,59 @@ class QueryResult:
         lines.append("  ".join("-" * w for w in widths))
 
         # Rows
-        for row in self.rows:
-            row_strs = []
-            for i, val in enumerate(row):
-                val_str = str(val) if val is not None else "NULL"
-                if len(val_str) > 60:
-                    val_str = val_str[:57] + "..."
-                row_strs.append(val_str.ljust(widths[i]))
-            lines.append("  ".join(row_strs))
+        for row_strs in cells:
+            lines.append("  ".join(val_str.ljust(widths[i]) for i, val_str in enumerate(row_strs)))
 
         return "\n".join(lines)
 
+    def write_csv(self, fp: IO[str], *, tsv: bool = False) -> None:
+        """Write rows as CSV (or TSV) to a text stream, one row at a time."""
+        writer = csv.writer(fp, dialect="excel-tab", lineterminator="\n") if tsv else csv.writer(fp)
+        writer.writerow(self.columns)
+        writer.writerows(self.rows)
+
+    def write_json(self, fp: IO[bytes]) -> None:
+        """Write rows as a JSON array of objects to a binary stream.
+
+        Rows are encoded a batch at a time and the batches spliced into one
+        array, so the output matches `to_json` without building the whole list.
+        """
+        columns = self.columns
+        separator = b"[\n"
+        for batch in itertools.batched(self.rows, 1000, strict=False):
+            data = [dict(zip(columns, row, strict=True)) for row in batch]
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+            # Drop the batch's own "[\n" and "\n]" brackets
+            fp.write(separator + encoded[2:-2])
+            separator = b",\n"
+        fp.write(b"[]" if separator == b"[\n" else b"\n]")
+
     def to_csv(self) -> str:
         """Format as CSV."""
         output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(self.columns)
-        writer.writerows(self.rows)
+        self.write_csv(output)
         return output.getvalue()
 
     def to_json(self) -> str:
         """Format as JSON array of objects."""
-        data = [dict(zip(self.columns, row, strict=True)) for row in self.rows]
-        return json.dumps(data, indent=2, default=str)
+        output = io.BytesIO()
+        self.write_json(output)
+        return output.getvalue().decode()
+
+
+def _iter_rows(cur: sqlite3.Cursor, batch_size: int = 1000) -> Iterator[tuple]:
+    """Yield a cursor's rows, fetching them in batches."""
+    while batch := cur.fetchmany(batch_size):
+        yield from batch
 
 
-def execute_query(sql: str) -> QueryResult:
+def execute_query(sql: str, stream: bool = False) -> QueryResult:
     """Execute a SQL query and return results.
 
     Args:
         sql: SQL query to execute.
+        stream: If True, rows are read from the cursor as the result is
+            written instead of being fetched up front.
 
     Returns:
         QueryResult with columns and rows.
@@ -179,8 +245,8 @@ def execute_query(sql: str) -> QueryResult:
     if not is_safe_query(sql):
         raise ValueError("Only SELECT, WITH, and EXPLAIN queries are allowed")
 
-    with get_connection(row_factory=False) as conn:
+    with get_connection() as conn:
         cur = conn.execute(sql)
         columns = [desc[0] for desc in cur.description] if cur.description else []
-        rows = cur.fetchall()
+        rows = _iter_rows(cur) if stream else cur.fetchall()
         return QueryResult(columns=columns, rows=rows)
@@ -0,0 +1,85 @@
+"""Request rate limiting for polite ALM pagination."""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+# Statuses that mean "slow down", retried rather than surfaced as errors
+RETRY_STATUSES = frozenset({429, 503})
+MAX_RETRIES = 5
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second, bursting up to `burst`.
+
+    Callers that arrive when the bucket is empty reserve a future slot, so
+    concurrent waiters are spaced out evenly instead of all waking at once.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Requests per second. Zero or negative disables limiting.
+            burst: Maximum number of requests allowed back-to-back.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+def retry_delay(retry_after: str | None, attempt: int, cap: float = 60.0) -> float:
+    """Get how long to wait before retrying a throttled request.
+
+    Args:
+        retry_after: The response's Retry-After header, either delta-seconds
+            or an HTTP-date. Honored as-is when it parses.
+        attempt: Zero-based retry number, for exponential backoff when the
+            server doesn't say how long to wait.
+        cap: Maximum backoff in seconds (doesn't limit Retry-After).
+
+    Returns:
+        Seconds to sleep.
+    """
+    if retry_after:
+        value = retry_after.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=UTC)
+            return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+    return min(2.0**attempt, cap)
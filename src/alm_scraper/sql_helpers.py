@@ -1,4 +1,10 @@
-"""SQL building helpers for consistent query construction."""
+"""SQL building helpers for consistent query construction.
+
+Fragments that depend only on their arguments and the constants module are
+cached, so hot query paths get the same string back instead of rebuilding it.
+"""
+
+import functools
 
 from alm_scraper.constants import (
     CONVERGINT_OWNER_PATTERN,
@@ -9,6 +15,7 @@ from alm_scraper.constants import (
 )
 
 
+@functools.cache
 def terminal_status_filter(*, exclude: bool = True, use_placeholders: bool = False) -> str:
     """Build SQL fragment for filtering by terminal status.
 
@@ -45,6 +52,7 @@ def terminal_status_params() -> list[str]:
     return list(TERMINAL_STATUSES)
 
 
+@functools.cache
 def age_bucket_case_sql(date_field: str = "created") -> str:
     """Build SQL CASE expression for age bucketing.
 
@@ -63,6 +71,7 @@ def age_bucket_case_sql(date_field: str = "created") -> str:
     END"""
 
 
+@functools.cache
 def age_days_sql(date_field: str = "created") -> str:
     """Build SQL expression for age in days as integer.
 
@@ -75,6 +84,7 @@ def age_days_sql(date_field: str = "created") -> str:
     return f"CAST(julianday('now') - julianday({date_field}) AS INTEGER)"
 
 
+@functools.cache
 def age_expr_sql(date_field: str = "created") -> str:
     """Build SQL expression for age calculation (floating point).
 
@@ -87,6 +97,7 @@ def age_expr_sql(date_field: str = "created") -> str:
     return f"julianday('now') - julianday({date_field})"
 
 
+@functools.cache
 def priority_sort_case_sql(field: str = "priority") -> str:
     """Build SQL CASE expression for priority ordering.
 
@@ -103,6 +114,7 @@ def priority_sort_case_sql(field: str = "priority") -> str:
     END"""
 
 
+@functools.cache
 def high_priority_filter(field: str = "priority") -> str:
     """Build SQL fragment for filtering high priority defects.
 
@@ -116,6 +128,7 @@ def high_priority_filter(field: str = "priority") -> str:
     return f"{field} IN ({quoted})"
 
 
+@functools.cache
 def convergint_owner_filter(field: str = "owner") -> str:
     """Build SQL fragment for filtering Convergint-owned defects.
 
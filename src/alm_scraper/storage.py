@@ -5,9 +5,14 @@ import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
 
-from pydantic import BaseModel
-
-from alm_scraper.defect import Defect
+from pydantic import BaseModel, ValidationError
+
+from alm_scraper.defect import Defect, dump_defects_json
+from alm_scraper.sql_helpers import (
+    convergint_owner_filter,
+    priority_sort_case_sql,
+    terminal_status_filter,
+)
 from alm_scraper.utils import write_json
 
 
@@ -17,6 +22,15 @@ class SyncMeta(BaseModel):
     last_sync: str
     defect_count: int
     current: str  # relative path to current history files (without extension)
+    last_modified: str | None = None  # newest defect 'modified' value at sync time
+
+    def is_current(self, defect_count: int, last_modified: str | None) -> bool:
+        """Check whether the server's defect count and newest change match this sync."""
+        return (
+            last_modified is not None
+            and self.last_modified == last_modified
+            and self.defect_count == defect_count
+        )
 
 
 def get_data_dir() -> Path:
@@ -43,8 +57,58 @@ def write_defects_json(defects: list[Defect], path: Path) -> None:
         defects: List of defects to write.
         path: Path to write to.
     """
-    data = [d.model_dump() for d in defects]
-    write_json(path, data)
+    # Serialized straight from the models; the SQLite build reads the same
+    # Defect objects, so no intermediate dicts are built for either output
+    path.write_bytes(dump_defects_json(defects) + b"\n")
+
+
+_INSERT_DEFECT_SQL = """
+    INSERT INTO defects (
+        id, name, status, priority, severity, owner, detected_by,
+        description, description_html, dev_comments, dev_comments_html,
+        created, modified, closed, reproducible, attachment,
+        detected_in_rel, detected_in_rcyc, actual_fix_time,
+        defect_type, application, workstream, module, target_date,
+        scenarios, blocks, integrations, clean_name
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+
+def _defect_row(defect: Defect) -> tuple:
+    """Get a defect's values in `_INSERT_DEFECT_SQL` column order."""
+    return (
+        defect.id,
+        defect.name,
+        defect.status,
+        defect.priority,
+        defect.severity,
+        defect.owner,
+        defect.detected_by,
+        defect.description,
+        defect.description_html,
+        defect.dev_comments,
+        defect.dev_comments_html,
+        defect.created,
+        defect.modified,
+        defect.closed,
+        defect.reproducible,
+        defect.attachment,
+        defect.detected_in_rel,
+        defect.detected_in_rcyc,
+        defect.actual_fix_time,
+        defect.defect_type,
+        defect.application,
+        defect.workstream,
+        defect.module,
+        defect.target_date,
+        ",".join(defect.scenarios) if defect.scenarios else None,
+        ",".join(defect.blocks) if defect.blocks else None,
+        ",".join(defect.integrations) if defect.integrations else None,
+        defect.clean_name,
+    )
 
 
 def build_sqlite_db(defects: list[Defect], db_path: Path) -> None:
@@ -62,8 +126,19 @@ def build_sqlite_db(defects: list[Defect], db_path: Path) -> None:
     try:
         cur = conn.cursor()
 
-        # Create main defects table
-        cur.execute("""
+        # The file is built under a temporary name and only renamed into place
+        # once complete, so a crash mid-build loses nothing worth keeping and
+        # the journal can be skipped. synchronous stays at its default: the
+        # commit's fsync is what makes the file durable before the rename.
+        cur.execute("PRAGMA journal_mode = OFF")
+        cur.execute("PRAGMA temp_store = MEMORY")
+        cur.execute("PRAGMA cache_size = -65536")
+
+        # Create main defects table. priority_rank orders priorities by
+        # PRIORITY_ORDER rather than as text, and is stored so it can be indexed.
+        # STRICT makes SQLite reject a value of the wrong type instead of
+        # silently storing it with whatever affinity applies.
+        cur.execute(f"""
             CREATE TABLE defects (
                 id INTEGER PRIMARY KEY,
                 name TEXT NOT NULL,
@@ -92,11 +167,47 @@ def build_sqlite_db(defects: list[Defect], db_path: Path) -> None:
                 scenarios TEXT,
                 blocks TEXT,
                 integrations TEXT,
-                clean_name TEXT
-            )
+                clean_name TEXT,
+                priority_rank INTEGER GENERATED ALWAYS AS ({priority_sort_case_sql()}) STORED
+            ) STRICT
         """)
 
-        # Create FTS5 virtual table for full-text search
+        # Insert defects. sqlite3 opens one transaction for all the rows,
+        # committed below, and executemany reuses a single prepared statement.
+        cur.executemany(_INSERT_DEFECT_SQL, map(_defect_row, defects))
+
+        # Create indexes for common queries
+        cur.execute("CREATE INDEX idx_status ON defects(status)")
+        cur.execute("CREATE INDEX idx_owner ON defects(owner)")
+        cur.execute("CREATE INDEX idx_priority ON defects(priority)")
+        # Case-insensitive filters (list/count) compare with COLLATE NOCASE
+        cur.execute("CREATE INDEX idx_status_nocase ON defects(status COLLATE NOCASE)")
+        cur.execute("CREATE INDEX idx_priority_nocase ON defects(priority COLLATE NOCASE)")
+        # Matches list ordering (priority rank, then created, then id via the
+        # rowid) so paging walks the index instead of sorting
+        cur.execute(
+            "CREATE INDEX idx_priority_rank_created ON defects(priority_rank, priority, created)"
+        )
+        # Date-range scans (e.g. the UI's weekly velocity)
+        cur.execute("CREATE INDEX idx_created ON defects(created)")
+        # Stats and the UI filter on LOWER(status); these match that expression
+        # exactly so the planner can use them, and the partial index makes the
+        # oldest-active lookup a read from the front of the index
+        cur.execute("CREATE INDEX idx_status_lower ON defects(LOWER(status))")
+        cur.execute(
+            "CREATE INDEX idx_active_created ON defects(created) "
+            f"WHERE {terminal_status_filter(exclude=True)}"
+        )
+        # The UI's Convergint scorecard and stale list both filter on active
+        # Convergint-owned defects; this covers those queries and yields rows
+        # already grouped by owner
+        cur.execute(
+            "CREATE INDEX idx_active_convergint "
+            "ON defects(owner, priority, modified, created) "
+            f"WHERE {terminal_status_filter(exclude=True)} AND {convergint_owner_filter()}"
+        )
+
+        # Create the FTS5 index last, once the rows are in, and fill it in one pass
         cur.execute("""
             CREATE VIRTUAL TABLE defects_fts USING fts5(
                 name,
@@ -108,64 +219,14 @@ def build_sqlite_db(defects: list[Defect], db_path: Path) -> None:
                 content_rowid='id'
             )
         """)
-
-        # Insert defects
-        for defect in defects:
-            cur.execute(
-                """
-                INSERT INTO defects (
-                    id, name, status, priority, severity, owner, detected_by,
-                    description, description_html, dev_comments, dev_comments_html,
-                    created, modified, closed, reproducible, attachment,
-                    detected_in_rel, detected_in_rcyc, actual_fix_time,
-                    defect_type, application, workstream, module, target_date,
-                    scenarios, blocks, integrations, clean_name
-                ) VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-                """,
-                (
-                    defect.id,
-                    defect.name,
-                    defect.status,
-                    defect.priority,
-                    defect.severity,
-                    defect.owner,
-                    defect.detected_by,
-                    defect.description,
-                    defect.description_html,
-                    defect.dev_comments,
-                    defect.dev_comments_html,
-                    defect.created,
-                    defect.modified,
-                    defect.closed,
-                    defect.reproducible,
-                    defect.attachment,
-                    defect.detected_in_rel,
-                    defect.detected_in_rcyc,
-                    defect.actual_fix_time,
-                    defect.defect_type,
-                    defect.application,
-                    defect.workstream,
-                    defect.module,
-                    defect.target_date,
-                    ",".join(defect.scenarios) if defect.scenarios else None,
-                    ",".join(defect.blocks) if defect.blocks else None,
-                    ",".join(defect.integrations) if defect.integrations else None,
-                    defect.clean_name,
-                ),
-            )
-
-        # Populate FTS index
         cur.execute("""
             INSERT INTO defects_fts(defects_fts) VALUES('rebuild')
         """)
 
-        # Create indexes for common queries
-        cur.execute("CREATE INDEX idx_status ON defects(status)")
-        cur.execute("CREATE INDEX idx_owner ON defects(owner)")
-        cur.execute("CREATE INDEX idx_priority ON defects(priority)")
+        # Record index statistics so the planner can choose between them.
+        # Readers open the database read-only and the file is never written
+        # again, so this is the one place it can run.
+        cur.execute("ANALYZE")
 
         conn.commit()
     finally:
@@ -192,22 +253,51 @@ def update_symlinks(data_dir: Path, history_base: str) -> None:
     db_link.symlink_to(f"{history_base}.db")
 
 
-def write_sync_meta(data_dir: Path, defect_count: int, history_base: str) -> None:
+def write_sync_meta(
+    data_dir: Path,
+    defect_count: int,
+    history_base: str,
+    last_modified: str | None = None,
+) -> None:
     """Write sync metadata file.
 
     Args:
         data_dir: The data directory.
         defect_count: Number of defects synced.
         history_base: Base name in history dir.
+        last_modified: Newest defect 'modified' timestamp in this sync.
     """
     meta = SyncMeta(
         last_sync=datetime.now(UTC).isoformat(),
         defect_count=defect_count,
         current=history_base,
+        last_modified=last_modified,
     )
 
+    # Written under a temporary name and renamed, so readers never see a
+    # partial file
     meta_path = data_dir / "sync_meta.json"
-    write_json(meta_path, meta.model_dump())
+    meta_tmp = data_dir / "sync_meta.json.tmp"
+    write_json(meta_tmp, meta.model_dump())
+    meta_tmp.replace(meta_path)
+
+
+def read_sync_meta() -> SyncMeta | None:
+    """Read the current sync metadata.
+
+    Returns:
+        SyncMeta if a sync has completed and its data is present, None otherwise
+        (including when the metadata file is unreadable or corrupt, so the
+        next sync runs in full and rewrites it).
+    """
+    data_dir = get_data_dir()
+    meta_path = data_dir / "sync_meta.json"
+    if not (data_dir / "defects.db").exists():
+        return None
+    try:
+        return SyncMeta.model_validate_json(meta_path.read_bytes())
+    except (OSError, ValidationError):
+        return None
 
 
 class SyncResult(BaseModel, arbitrary_types_allowed=True):
@@ -268,7 +358,8 @@ def sync_defects(defects: list[Defect]) -> SyncResult:
     update_symlinks(data_dir, history_base)
 
     # Write metadata
-    write_sync_meta(data_dir, len(defects), history_base)
+    last_modified = max((d.modified for d in defects if d.modified), default=None)
+    write_sync_meta(data_dir, len(defects), history_base, last_modified)
 
     return SyncResult(
         data_dir=data_dir,
@@ -313,7 +313,7 @@ async def get_defects(
 async def get_scenarios() -> dict:
     """Get all unique scenario codes for filtering."""
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
             cur.execute("SELECT scenarios FROM defects WHERE scenarios IS NOT NULL")
             all_scenarios: set[str] = set()
@@ -344,7 +344,7 @@ async def get_burndown() -> dict:
     from datetime import datetime, timedelta
 
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
 
             # Get daily opened counts
@@ -472,7 +472,7 @@ async def get_burndown() -> dict:
 async def get_aging() -> dict:
     """Get aging analysis of active defects."""
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
 
             active_filter = terminal_status_filter(exclude=True)
@@ -553,7 +553,7 @@ async def get_aging() -> dict:
 async def get_velocity() -> dict:
     """Get weekly velocity (opened vs resolved)."""
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
 
             # Get weekly opened counts (last 12 weeks)
@@ -617,7 +617,7 @@ async def get_velocity() -> dict:
 async def get_priority_trend() -> dict:
     """Get priority breakdown trend over time (weekly snapshots)."""
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
 
             # For each week, count active defects by priority
@@ -681,7 +681,7 @@ async def get_priority_trend() -> dict:
 async def get_executive_summary() -> dict:
     """Get executive-level summary with ownership and actionable metrics."""
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
 
             active_filter = terminal_status_filter(exclude=True)
@@ -866,7 +866,7 @@ async def get_kanban(
         lanes: List of lane values if lane parameter provided
     """
     try:
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
 
             # Build status filter - exclude hidden statuses unless requested
@@ -965,7 +965,7 @@ async def get_stats_endpoint(include_closed: bool = False) -> dict:
     try:
         active_filter = terminal_status_filter(exclude=True)
 
-        with get_connection(row_factory=False) as conn:
+        with get_connection() as conn:
             cur = conn.cursor()
             # Count defects per scenario (for active defects only)
             status_filter = "" if include_closed else f"WHERE {active_filter}"
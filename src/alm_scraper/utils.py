@@ -29,7 +29,7 @@ def strip_domain(owner: str) -> str:
     Returns:
         Username without domain.
     """
-    return owner.split("_")[0] if "_" in owner else owner
+    return owner.partition("_")[0]
 
 
 def write_json(path: Path, data: dict | list, indent: int = 2) -> None:
@@ -41,6 +41,5 @@ def write_json(path: Path, data: dict | list, indent: int = 2) -> None:
         indent: JSON indentation level.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w") as f:
-        json.dump(data, f, indent=indent)
-        f.write("\n")
+    # Encode up front so the file is written in one call, not one per token
+    path.write_text(json.dumps(data, indent=indent) + "\n")
@@ -0,0 +1,125 @@
+"""Tests for the ALM REST client's paging and retries."""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from alm_scraper.api import ALMClient
+from alm_scraper.config import Config
+from alm_scraper.rate_limit import MAX_RETRIES
+
+CONFIG = Config(base_url="https://alm.test", domain="D", project="P", cookies={})
+
+
+def _client(handler: Any) -> ALMClient:
+    return ALMClient(CONFIG, rate=0, transport=httpx.MockTransport(handler))
+
+
+class FakeALM:
+    """Serves `total` numbered entities in pages, as ALM's defects endpoint does."""
+
+    def __init__(self, total: int, first_page_size: int | None = None) -> None:
+        self.total = total
+        self.first_page_size = first_page_size
+        self.starts: list[int] = []
+        self.completed: list[int] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params["start-index"])
+        size = int(request.url.params["page-size"])
+        self.starts.append(start)
+        if start == 1 and self.first_page_size is not None:
+            size = self.first_page_size
+        # Later pages answer sooner, so pages complete out of order
+        await asyncio.sleep(0.02 * max(self.total - start, 0) / max(size, 1))
+        self.completed.append(start)
+        ids = range(start, min(start + size, self.total + 1))
+        body = {"entities": [{"id": i} for i in ids], "TotalResults": self.total}
+        return httpx.Response(200, json=body)
+
+
+def _fetch_async(server: Any, page_size: int = 2) -> dict[str, Any]:
+    with _client(server) as client:
+        return asyncio.run(client.fetch_all_defects_async(page_size=page_size, concurrency=4))
+
+
+class TestFetchAllDefectsAsync:
+    def test_pages_completing_out_of_order_keep_id_order(self) -> None:
+        server = FakeALM(total=9)
+        data = _fetch_async(server)
+        assert [e["id"] for e in data["entities"]] == list(range(1, 10))
+        assert data["TotalResults"] == 9
+        assert server.completed == [1, 9, 7, 5, 3]
+
+    def test_total_is_exact_multiple_of_page_size(self) -> None:
+        server = FakeALM(total=6)
+        data = _fetch_async(server)
+        assert [e["id"] for e in data["entities"]] == list(range(1, 7))
+        assert sorted(server.starts) == [1, 3, 5]
+
+    def test_no_results(self) -> None:
+        server = FakeALM(total=0)
+        data = _fetch_async(server)
+        assert data == {"entities": [], "TotalResults": 0}
+        assert server.starts == [1]
+
+    def test_short_first_page_stops(self) -> None:
+        server = FakeALM(total=9, first_page_size=1)
+        data = _fetch_async(server)
+        assert [e["id"] for e in data["entities"]] == [1]
+        assert server.starts == [1]
+
+    def test_error_on_gathered_page_is_raised(self) -> None:
+        pages = FakeALM(total=9)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["start-index"] == "5":
+                return httpx.Response(500)
+            return await pages(request)
+
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            _fetch_async(handler)
+        assert exc_info.value.response.status_code == 500
+
+
+class Throttled:
+    """Answers 429 (Retry-After: 0) `times` times, then serves one page."""
+
+    def __init__(self, times: int) -> None:
+        self.times = times
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.calls <= self.times:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"entities": [{"id": 1}], "TotalResults": 1})
+
+
+class TestRetries:
+    def test_429_then_200_returns_page(self) -> None:
+        server = Throttled(times=1)
+        with _client(server) as client:
+            assert client.fetch_defects_page()["entities"] == [{"id": 1}]
+        assert server.calls == 2
+
+    def test_gives_up_after_max_retries(self) -> None:
+        server = Throttled(times=MAX_RETRIES + 1)
+        with _client(server) as client, pytest.raises(httpx.HTTPStatusError) as exc_info:
+            client.fetch_defects_page()
+        assert exc_info.value.response.status_code == 429
+        assert server.calls == MAX_RETRIES + 1
+
+    def test_async_429_then_200_returns_page(self) -> None:
+        server = Throttled(times=1)
+        assert _fetch_async(server, page_size=500)["entities"] == [{"id": 1}]
+        assert server.calls == 2
+
+    def test_async_gives_up_after_max_retries(self) -> None:
+        server = Throttled(times=MAX_RETRIES + 1)
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            _fetch_async(server)
+        assert exc_info.value.response.status_code == 429
+        assert server.calls == MAX_RETRIES + 1
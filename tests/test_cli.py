@@ -1,6 +1,16 @@
+import functools
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
 from click.testing import CliRunner
 
+from alm_scraper import api, config
 from alm_scraper.cli import main
+from alm_scraper.config import Config
+from alm_scraper.defect import Defect
+from alm_scraper.storage import build_sqlite_db, get_data_dir, sync_defects
 
 
 def test_main_shows_help() -> None:
@@ -15,3 +25,107 @@ def test_version() -> None:
     result = runner.invoke(main, ["--version"])
     assert result.exit_code == 0
     assert "0.1.0" in result.output
+
+
+@pytest.mark.parametrize("fmt", [[], ["--csv"], ["--json"]])
+def test_query_reports_errors_raised_mid_stream(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fmt: list[str]
+) -> None:
+    # The second row's name isn't valid JSON, so json() fails once the first
+    # row has been read
+    defects = [Defect(id=1, name="1", status="Open"), Defect(id=2, name="x", status="Open")]
+    build_sqlite_db(defects, tmp_path / "defects.db")
+    monkeypatch.setenv("ALM_DATA_DIR", str(tmp_path))
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["query", *fmt, "SELECT json(name) FROM defects"])
+    assert result.exit_code == 1
+    assert isinstance(result.exception, SystemExit)
+    assert "SQL Error: malformed JSON" in result.stderr
+
+
+def _entity(defect_id: int, modified: str) -> dict[str, Any]:
+    fields = {"id": str(defect_id), "name": f"Defect {defect_id}", "last-modified": modified}
+    return {"Fields": [{"Name": k, "values": [{"value": v}]} for k, v in fields.items()]}
+
+
+class FakeALM:
+    """Answers summary and page requests for a fixed set of defects."""
+
+    def __init__(self, entities: list[dict[str, Any]]) -> None:
+        self.entities = entities
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        params = request.url.params
+        if params.get("fields") == "last-modified":
+            newest = max(self.entities, key=lambda e: e["Fields"][2]["values"][0]["value"])
+            body = {"entities": [newest], "TotalResults": len(self.entities)}
+        else:
+            start = int(params["start-index"]) - 1
+            size = int(params["page-size"])
+            body = {
+                "entities": self.entities[start : start + size],
+                "TotalResults": len(self.entities),
+            }
+        return httpx.Response(200, json=body)
+
+
+class TestSyncSkip:
+    @pytest.fixture
+    def synced(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """A data dir holding one earlier sync of defects 1 and 2."""
+        monkeypatch.setenv("ALM_DATA_DIR", str(tmp_path))
+        cfg = Config(base_url="https://alm.test", domain="D", project="P", cookies={})
+        monkeypatch.setattr(config, "load_config", lambda: cfg)
+        sync_defects(
+            [
+                Defect(id=1, name="Defect 1", modified="2024-01-01 09:00:00"),
+                Defect(id=2, name="Defect 2", modified="2024-01-02 09:00:00"),
+            ]
+        )
+        return tmp_path
+
+    def _sync(self, monkeypatch: pytest.MonkeyPatch, server: FakeALM) -> Any:
+        transport = httpx.MockTransport(server)
+        monkeypatch.setattr(api, "ALMClient", functools.partial(api.ALMClient, transport=transport))
+        return CliRunner().invoke(main, ["sync", "--no-cache", "--rate", "0"])
+
+    def test_unchanged_returns_after_one_request(
+        self, synced: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        server = FakeALM([_entity(1, "2024-01-01 09:00:00"), _entity(2, "2024-01-02 09:00:00")])
+        result = self._sync(monkeypatch, server)
+        assert result.exit_code == 0
+        assert "Already up to date (2 defects)" in result.stderr
+        assert len(server.requests) == 1
+
+    def test_count_differs_syncs(self, synced: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        server = FakeALM(
+            [
+                _entity(1, "2024-01-01 09:00:00"),
+                _entity(2, "2024-01-02 09:00:00"),
+                _entity(3, "2024-01-02 09:00:00"),
+            ]
+        )
+        result = self._sync(monkeypatch, server)
+        assert result.exit_code == 0
+        assert "Synced 3 defects" in result.stderr
+        assert len(server.requests) > 1
+
+    def test_meta_without_last_modified_syncs(
+        self, synced: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sync_defects([Defect(id=1, name="Defect 1"), Defect(id=2, name="Defect 2")])
+        server = FakeALM([_entity(1, "2024-01-01 09:00:00"), _entity(2, "2024-01-02 09:00:00")])
+        result = self._sync(monkeypatch, server)
+        assert result.exit_code == 0
+        assert "Synced 2 defects" in result.stderr
+
+    def test_corrupt_meta_syncs(self, synced: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (get_data_dir() / "sync_meta.json").write_text('{"last_sync": ')
+        server = FakeALM([_entity(1, "2024-01-01 09:00:00"), _entity(2, "2024-01-02 09:00:00")])
+        result = self._sync(monkeypatch, server)
+        assert result.exit_code == 0
+        assert "Synced 2 defects" in result.stderr
@@ -0,0 +1,67 @@
+"""Tests for configuration loading."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from alm_scraper.config import Config, get_config_path, load_config
+
+DATA: dict[str, Any] = {
+    "base_url": "https://alm.test",
+    "domain": "D",
+    "project": "P",
+    "cookies": {"session": "abc"},
+}
+
+
+class TestConfigFromDict:
+    def test_missing_key(self) -> None:
+        data = {k: v for k, v in DATA.items() if k != "project"}
+        with pytest.raises(ValueError, match="missing 'project'"):
+            Config.from_dict(data)
+
+    def test_non_string_cookie_value(self) -> None:
+        with pytest.raises(ValueError, match="cookies"):
+            Config.from_dict(DATA | {"cookies": {"session": 1}})
+
+    def test_unknown_keys_are_ignored(self) -> None:
+        config = Config.from_dict(DATA | {"theme": "dark"})
+        assert config == Config(**DATA)
+
+    def test_cookies_are_read_only(self) -> None:
+        cookies = {"session": "abc"}
+        config = Config.from_dict(DATA | {"cookies": cookies})
+        with pytest.raises(TypeError):
+            config.cookies["session"] = "changed"  # type: ignore[index]
+        # Later changes to the source dict don't leak in either
+        cookies["session"] = "changed"
+        assert config.cookies["session"] == "abc"
+
+
+class TestLoadConfig:
+    def test_reloads_after_file_is_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HOME", str(tmp_path))
+        path = get_config_path()
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(DATA))
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        first = load_config()
+        assert first is not None
+        assert load_config() is first
+
+        path.write_text(json.dumps(DATA | {"project": "Q"}))
+        os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+        second = load_config()
+        assert second is not None
+        assert second is not first
+        assert second.project == "Q"
+
+    def test_missing_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert load_config() is None
@@ -1,8 +1,12 @@
 """Tests for curl command parsing."""
 
+import shlex
+
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 
-from alm_scraper.curl_parser import parse_cookies, parse_curl
+from alm_scraper.curl_parser import _split_words, parse_cookies, parse_curl
 
 
 class TestParseCookies:
@@ -22,6 +26,10 @@ class TestParseCookies:
         result = parse_cookies("  foo = bar ;  baz=qux  ")
         assert result == {"foo": "bar", "baz": "qux"}
 
+    def test_values_are_not_url_decoded(self) -> None:
+        result = parse_cookies("token=a+b/c%3D%3D; other=x%20y")
+        assert result == {"token": "a+b/c%3D%3D", "other": "x%20y"}
+
 
 class TestParseCurl:
     def test_basic_curl(self) -> None:
@@ -84,3 +92,15 @@ class TestParseCurl:
     def test_not_curl_raises(self) -> None:
         with pytest.raises(ValueError, match="must start with 'curl'"):
             parse_curl("wget https://example.com")
+
+
+class TestSplitWords:
+    @given(st.text(alphabet=" \t\n'\"\\ab=-;"))
+    def test_matches_shlex(self, command: str) -> None:
+        try:
+            expected = shlex.split(command)
+        except ValueError:
+            with pytest.raises(ValueError):
+                _split_words(command)
+        else:
+            assert _split_words(command) == expected
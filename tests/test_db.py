@@ -0,0 +1,170 @@
+"""Tests for database query building."""
+
+import json
+import sqlite3
+import string
+from pathlib import Path
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from alm_scraper import db
+from alm_scraper.db import (
+    _DEFECT_SELECT,
+    Stats,
+    _build_filter_query,
+    _escape_like,
+    get_defect_by_id,
+    get_stats,
+    list_defects,
+)
+from alm_scraper.defect import Defect
+from alm_scraper.storage import build_sqlite_db
+
+values = st.lists(st.text(min_size=1), min_size=1, max_size=10).map(tuple)
+
+
+class TestBuildFilterQuery:
+    @given(a=values, b=values)
+    def test_sql_text_is_independent_of_value_count(
+        self, a: tuple[str, ...], b: tuple[str, ...]
+    ) -> None:
+        where_a, _ = _build_filter_query(priority=a, owner=a)
+        where_b, _ = _build_filter_query(priority=b, owner=b)
+        assert where_a == where_b
+
+    @given(priority=values, owner=values)
+    def test_binds_one_json_array_per_filter(
+        self, priority: tuple[str, ...], owner: tuple[str, ...]
+    ) -> None:
+        _, params = _build_filter_query(priority=priority, owner=owner)
+        assert [json.loads(p) for p in params] == [
+            list(priority),
+            [f"%{_escape_like(v)}%" for v in owner],
+        ]
+
+    def test_no_filters_matches_everything(self) -> None:
+        assert _build_filter_query() == ("1=1", [])
+
+    @given(
+        owner=st.text(alphabet=string.printable, max_size=20),
+        needle=st.text(alphabet=string.printable, min_size=1, max_size=5),
+    )
+    def test_partial_match_is_literal_substring(self, owner: str, needle: str) -> None:
+        where, params = _build_filter_query(owner=(needle,))
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE defects (owner TEXT)")
+        conn.execute("INSERT INTO defects VALUES (?)", (owner,))
+        matched = conn.execute(f"SELECT COUNT(*) FROM defects WHERE {where}", params).fetchone()[0]
+        assert bool(matched) == (needle.lower() in owner.lower())
+
+
+class TestGetDefectById:
+    def test_mutating_result_does_not_leak_into_later_lookups(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        db_path = tmp_path / "defects.db"
+        build_sqlite_db([Defect(id=1, name="Original", status="Open")], db_path)
+        monkeypatch.setattr(db, "get_db_path", lambda: db_path)
+
+        first = get_defect_by_id(1)
+        assert first is not None
+        first.name = "Changed"
+
+        second = get_defect_by_id(1)
+        assert second is not None
+        assert second.name == "Original"
+
+
+class TestListDefects:
+    def test_lists_from_database_without_priority_rank(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        defects = [
+            Defect(id=1, name="a", status="Open", priority="P3-Medium", created="2024-01-01"),
+            Defect(id=2, name="b", status="Open", priority="Other", created="2024-01-01"),
+            Defect(id=3, name="c", status="Closed", priority="P1-Critical", created="2024-02-01"),
+            Defect(id=4, name="d", status="Open", priority="P1-Critical", created="2024-01-15"),
+        ]
+        current = tmp_path / "current.db"
+        build_sqlite_db(defects, current)
+        # A database synced before the stored priority_rank column existed
+        legacy = tmp_path / "legacy.db"
+        conn = sqlite3.connect(legacy)
+        conn.execute("ATTACH DATABASE ? AS current", (str(current),))
+        conn.execute(f"CREATE TABLE defects AS SELECT {_DEFECT_SELECT} FROM current.defects")
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(db, "get_db_path", lambda: legacy)
+        assert [d.id for d in list_defects()] == [4, 3, 1, 2]
+        assert [d.id for d in list_defects(status=("open",), limit=2)] == [4, 1]
+
+        monkeypatch.setattr(db, "get_db_path", lambda: current)
+        assert [d.id for d in list_defects()] == [4, 3, 1, 2]
+
+
+class TestGetStats:
+    def _stats(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        defects: list[Defect],
+        top_n: int = 5,
+    ) -> Stats:
+        db_path = tmp_path / "defects.db"
+        build_sqlite_db(defects, db_path)
+        monkeypatch.setattr(db, "get_db_path", lambda: db_path)
+        stats = get_stats(top_n=top_n)
+        assert stats is not None
+        return stats
+
+    @pytest.mark.parametrize(
+        ("days", "p50", "p75"),
+        [([5], 5, 5), ([3, 1], 3, 3), ([8, 1, 4, 2], 4, 8)],
+    )
+    def test_close_time_percentiles_by_position(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        days: list[int],
+        p50: int,
+        p75: int,
+    ) -> None:
+        defects = [
+            Defect(
+                id=i, name="d", status="Closed", created="2024-01-01", closed=f"2024-01-{1 + d:02}"
+            )
+            for i, d in enumerate(days, start=1)
+        ]
+        # Closed before it was created: not a close time
+        defects.append(
+            Defect(id=99, name="d", status="Closed", created="2024-02-01", closed="2024-01-01")
+        )
+        close_time = self._stats(tmp_path, monkeypatch, defects).close_time
+        assert close_time is not None
+        assert (close_time.p50, close_time.p75) == (p50, p75)
+        assert close_time.avg == pytest.approx(sum(days) / len(days))
+
+    def test_breakdowns(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        modules = ["A", "A", "D", "C", "B", None]
+        priorities = ["P4-Low", "P1-Critical", "P3-Medium", "P2-High", "Other", "P1-Critical"]
+        defects = [
+            Defect(id=i, name="d", status="Open", module=module, priority=priority)
+            for i, (module, priority) in enumerate(zip(modules, priorities, strict=True), start=1)
+        ]
+        defects.append(Defect(id=99, name="d", status="Closed", module="Z", priority="P9"))
+        stats = self._stats(tmp_path, monkeypatch, defects, top_n=3)
+
+        # Top N by count, ties by value; NULL reads "(none)"; closed excluded
+        assert stats.by_module == [("A", 2), ("(none)", 1), ("B", 1)]
+        # Priority is never truncated, and is sorted by name
+        assert stats.by_priority == [
+            ("Other", 1),
+            ("P1-Critical", 2),
+            ("P2-High", 1),
+            ("P3-Medium", 1),
+            ("P4-Low", 1),
+        ]
+        assert (stats.total, stats.open_count, stats.closed_count) == (7, 6, 1)
@@ -1,6 +1,14 @@
 """Tests for defect parsing."""
 
-from alm_scraper.defect import parse_alm_entity, parse_alm_response, strip_html
+from collections.abc import Iterator
+from typing import Any
+
+from alm_scraper.defect import (
+    parse_alm_entity,
+    parse_alm_response,
+    parse_alm_response_stream,
+    strip_html,
+)
 
 
 class TestStripHtml:
@@ -19,6 +27,10 @@ class TestStripHtml:
         html = "<p>   </p>"
         assert strip_html(html) is None
 
+    def test_strips_tags_after_xml_encoding_declaration(self) -> None:
+        html = '<?xml version="1.0" encoding="utf-8"?><p>Hello <b>world</b></p>'
+        assert strip_html(html) == "Hello world"
+
 
 class TestParseAlmEntity:
     def test_parses_basic_entity(self) -> None:
@@ -86,6 +98,18 @@ class TestParseAlmEntity:
         defect = parse_alm_entity(entity)
         assert defect.actual_fix_time == 42
 
+    def test_non_numeric_actual_fix_time_is_none(self) -> None:
+        entity = {
+            "Fields": [
+                {"Name": "id", "values": [{"value": "1"}]},
+                {"Name": "name", "values": [{"value": "Test"}]},
+                {"Name": "actual-fix-time", "values": [{"value": "n/a"}]},
+            ],
+        }
+
+        defect = parse_alm_entity(entity)
+        assert defect.actual_fix_time is None
+
 
 class TestParseAlmResponse:
     def test_parses_multiple_entities(self) -> None:
@@ -119,3 +143,20 @@ class TestParseAlmResponse:
         data = {"entities": [], "TotalResults": 0}
         defects = parse_alm_response(data)
         assert defects == []
+
+
+class TestParseAlmResponseStream:
+    def test_parses_lazily_in_order(self) -> None:
+        consumed: list[int] = []
+
+        def entities() -> Iterator[dict[str, Any]]:
+            for i in (1, 2):
+                consumed.append(i)
+                yield {"Fields": [{"Name": "id", "values": [{"value": str(i)}]}]}
+
+        stream = parse_alm_response_stream(entities())
+        assert consumed == []
+
+        assert next(stream).id == 1
+        assert consumed == [1]
+        assert [d.id for d in stream] == [2]
@@ -0,0 +1,43 @@
+"""Tests for output formatting."""
+
+import json
+
+from alm_scraper.db import Stats
+from alm_scraper.defect import Defect
+from alm_scraper.display import format_defect_json, format_defects_json, format_stats_json
+
+# --json output (and the synced defects.json) writes non-ASCII text as raw
+# UTF-8 rather than \uXXXX escapes, with json.dumps(indent=2) whitespace
+NAME = "Café façade — naïve ✓"
+
+
+def _defect() -> Defect:
+    return Defect(id=1, name=NAME, status="Open", owner="zoë", scenarios=[])
+
+
+class TestJsonEncoding:
+    def test_defects_json_writes_raw_utf8(self) -> None:
+        defects = [_defect()]
+        expected = json.dumps([d.model_dump() for d in defects], indent=2, ensure_ascii=False)
+        assert format_defects_json(defects) == expected
+        assert "\\u" not in format_defects_json(defects)
+
+    def test_defect_json_writes_raw_utf8(self) -> None:
+        defect = _defect()
+        expected = json.dumps(defect.model_dump(), indent=2, ensure_ascii=False)
+        assert format_defect_json(defect) == expected
+
+    def test_stats_json_writes_raw_utf8(self) -> None:
+        stats = Stats(
+            total=1,
+            open_count=1,
+            closed_count=0,
+            by_priority=[],
+            by_module=[],
+            by_owner=[("zoë", 1)],
+            by_type=[],
+            by_workstream=[],
+        )
+        output = format_stats_json(stats)
+        assert '"zoë": 1' in output
+        assert json.loads(output)["by_owner"] == {"zoë": 1}
@@ -0,0 +1,100 @@
+"""Tests for the conditional-request page cache."""
+
+from pathlib import Path
+
+import httpx
+
+from alm_scraper.api import ALMClient
+from alm_scraper.config import Config
+from alm_scraper.page_cache import PageCache
+
+CONFIG = Config(base_url="https://alm.test", domain="D", project="P", cookies={})
+PAGE = b'{"entities": [{"Fields": []}], "TotalResults": 1}'
+ETAG = '"v1"'
+
+
+class Server:
+    """Serves one page with an ETag, answering 304 when the client sends it back."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == ETAG:
+            return httpx.Response(304, headers={"ETag": ETAG})
+        return httpx.Response(200, content=PAGE, headers={"ETag": ETAG})
+
+
+def _body_file(cache_dir: Path) -> Path:
+    return next(p for p in cache_dir.glob("*.json") if not p.name.endswith(".meta.json"))
+
+
+def _fetch(cache: PageCache, server: Server) -> dict:
+    with ALMClient(CONFIG, cache=cache, rate=0, transport=httpx.MockTransport(server)) as client:
+        return client.fetch_defects_page()
+
+
+class TestPageCache:
+    def test_200_is_stored(self, tmp_path: Path) -> None:
+        cache = PageCache(tmp_path)
+        server = Server()
+        assert _fetch(cache, server)["TotalResults"] == 1
+
+        assert "If-None-Match" not in server.requests[0].headers
+        assert sorted(p.name.split(".", 1)[1] for p in tmp_path.iterdir()) == [
+            "json",
+            "meta.json",
+        ]
+
+    def test_304_is_served_from_cache(self, tmp_path: Path) -> None:
+        cache = PageCache(tmp_path)
+        _fetch(cache, Server())
+
+        server = Server()
+        assert _fetch(cache, server)["TotalResults"] == 1
+        assert len(server.requests) == 1
+        assert server.requests[0].headers["If-None-Match"] == ETAG
+
+    def test_304_with_missing_body_refetches(self, tmp_path: Path) -> None:
+        cache = PageCache(tmp_path)
+        _fetch(cache, Server())
+        body_path = _body_file(tmp_path)
+
+        # Validators were read, then the body vanished before the 304 arrived
+        server = Server()
+        original_load = cache.load
+
+        def load_after_delete(key: str) -> dict | None:
+            body_path.unlink(missing_ok=True)
+            return original_load(key)
+
+        cache.load = load_after_delete  # type: ignore[method-assign]
+        assert _fetch(cache, server)["TotalResults"] == 1
+        assert len(server.requests) == 2
+        assert "If-None-Match" not in server.requests[1].headers
+
+    def test_truncated_body_is_a_miss(self, tmp_path: Path) -> None:
+        cache = PageCache(tmp_path)
+        _fetch(cache, Server())
+        _body_file(tmp_path).write_bytes(PAGE[:10])
+
+        server = Server()
+        assert _fetch(cache, server)["TotalResults"] == 1
+        # The 304 couldn't be served, so the page was re-requested and re-stored
+        assert len(server.requests) == 2
+        assert _fetch(cache, Server())["TotalResults"] == 1
+
+    def test_truncated_meta_is_a_miss(self, tmp_path: Path) -> None:
+        cache = PageCache(tmp_path)
+        _fetch(cache, Server())
+        next(tmp_path.glob("*.meta.json")).write_text('{"etag": ')
+
+        server = Server()
+        assert _fetch(cache, server)["TotalResults"] == 1
+        assert "If-None-Match" not in server.requests[0].headers
+
+    def test_store_leaves_no_temp_files(self, tmp_path: Path) -> None:
+        cache = PageCache(tmp_path)
+        _fetch(cache, Server())
+        assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,45 @@
+"""Tests for SQL query helpers."""
+
+import orjson
+from hypothesis import given
+from hypothesis import strategies as st
+
+from alm_scraper.query import QueryResult, is_safe_query
+
+cells = st.none() | st.integers(-(2**63), 2**63 - 1) | st.text() | st.floats(allow_nan=False)
+
+
+class TestIsSafeQuery:
+    def test_accepts_read_only_statements(self) -> None:
+        assert is_safe_query("SELECT * FROM defects")
+        assert is_safe_query("  with x AS (SELECT 1) SELECT * FROM x")
+        assert is_safe_query("\nExplain QUERY PLAN SELECT 1")
+
+    def test_rejects_writes(self) -> None:
+        assert not is_safe_query("DELETE FROM defects")
+        assert not is_safe_query("UPDATE defects SET status = 'Closed'")
+        assert not is_safe_query("")
+
+    @given(
+        prefix=st.sampled_from(["", " ", "\t\n", "-- c\n"]),
+        keyword=st.sampled_from(["select", "SELECT", "With", "explain", "drop", "insert"]),
+        rest=st.text(max_size=20),
+    )
+    def test_matches_uppercased_prefix_check(self, prefix: str, keyword: str, rest: str) -> None:
+        sql = prefix + keyword + rest
+        expected = sql.strip().upper().startswith(("SELECT", "WITH", "EXPLAIN"))
+        assert is_safe_query(sql) == expected
+
+
+class TestQueryResultJson:
+    @given(rows=st.lists(st.tuples(cells, cells), max_size=5))
+    def test_streamed_json_matches_one_shot_dump(self, rows: list[tuple]) -> None:
+        expected = orjson.dumps(
+            [{"a": a, "b": b} for a, b in rows], option=orjson.OPT_INDENT_2
+        ).decode()
+        assert QueryResult(["a", "b"], iter(rows)).to_json() == expected
+
+    def test_spans_multiple_batches(self) -> None:
+        rows = [(i,) for i in range(2500)]
+        expected = orjson.dumps([{"n": i} for i in range(2500)], option=orjson.OPT_INDENT_2)
+        assert QueryResult(["n"], iter(rows)).to_json() == expected.decode()
@@ -0,0 +1,47 @@
+"""Tests for request rate limiting."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from alm_scraper.rate_limit import TokenBucket, retry_delay
+
+
+class TestTokenBucket:
+    def test_burst_is_free(self) -> None:
+        bucket = TokenBucket(rate=1.0, burst=3)
+        assert [bucket._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waiters_are_spaced_by_rate(self) -> None:
+        bucket = TokenBucket(rate=2.0, burst=1)
+        assert bucket._reserve() == 0.0
+        assert bucket._reserve() == pytest.approx(0.5, abs=0.01)
+        assert bucket._reserve() == pytest.approx(1.0, abs=0.01)
+
+    def test_zero_rate_disables_limiting(self) -> None:
+        bucket = TokenBucket(rate=0)
+        assert all(bucket._reserve() == 0.0 for _ in range(100))
+
+
+class TestRetryDelay:
+    def test_honors_delta_seconds(self) -> None:
+        assert retry_delay("120", attempt=0) == 120.0
+
+    def test_honors_http_date(self) -> None:
+        when = datetime.now(UTC) + timedelta(seconds=30)
+        assert retry_delay(format_datetime(when, usegmt=True), attempt=0) == pytest.approx(
+            30, abs=2
+        )
+
+    def test_past_http_date_means_no_wait(self) -> None:
+        assert retry_delay("Wed, 21 Oct 2015 07:28:00 GMT", attempt=0) == 0.0
+
+    def test_backs_off_exponentially_without_header(self) -> None:
+        assert [retry_delay(None, attempt=a) for a in range(4)] == [1.0, 2.0, 4.0, 8.0]
+
+    def test_backoff_is_capped(self) -> None:
+        assert retry_delay(None, attempt=20, cap=60.0) == 60.0
+
+    def test_unparseable_header_falls_back_to_backoff(self) -> None:
+        assert retry_delay("soon", attempt=1) == 2.0